@@ -1,6 +1,9 @@
 -- Database initialization script for TimeNest
 -- This creates the basic tables needed for the application
 
+-- btree_gist lets the composite GiST index below include the uuid column
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
 -- Create users table
 CREATE TABLE IF NOT EXISTS users (
     userid UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -42,6 +45,11 @@ CREATE INDEX IF NOT EXISTS idx_tasks_end_time ON tasks(end_time);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
 CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks(category);
+-- Turns per-user MAX(updated_at) (statistics cache validation) into an index probe
+CREATE INDEX IF NOT EXISTS idx_tasks_userid_updated_at ON tasks(userid, updated_at);
+-- Range index so schedule-conflict overlap checks are a single GiST scan
+CREATE INDEX IF NOT EXISTS idx_tasks_userid_timerange
+    ON tasks USING gist (userid, tstzrange(start_time, end_time, '[)'));
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 
@@ -16,7 +16,7 @@ from fastapi import APIRouter, Depends, Body, status, Request
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel, EmailStr, Field, validator
 
-from services.auth_service import AuthService, get_auth_service_dependency
+from services.auth_service import AuthService, UserContext, get_auth_service_dependency
 from api.middleware.authentication import get_current_user, require_auth
 from core.exceptions import (
     AuthenticationError,
@@ -292,7 +292,7 @@ async def refresh_token(
 )
 async def logout(
     request: LogoutRequest = Body(..., description="Logout data"),
-    current_user: Dict[str, Any] = Depends(require_auth),
+    current_user: UserContext = Depends(require_auth),
     auth_service: AuthService = Depends(get_auth_service_dependency)
 ) -> Dict[str, str]:
     """
@@ -308,7 +308,7 @@ async def logout(
         
         await auth_service.logout_user(access_token, request.refresh_token)
         
-        logger.info(f"User logged out: {current_user['user_id']}")
+        logger.info(f"User logged out: {current_user.user_id}")
         
         return {"message": "Logout successful"}
         
@@ -324,23 +324,25 @@ async def logout(
     description="Get current user profile information"
 )
 async def get_profile(
-    current_user: Dict[str, Any] = Depends(require_auth)
+    current_user: UserContext = Depends(require_auth)
 ) -> UserResponse:
     """
     Get the current authenticated user's profile information.
-    
+
     Returns user details excluding sensitive information like password hashes.
     """
     # TODO: Fetch complete user profile from database
     # For now, return data from JWT token
-    
+
+    extra_claims = current_user.extra or {}
+
     return UserResponse(
-        user_id=current_user["user_id"],
-        email=current_user["email"],
-        username=current_user.get("username", ""),
-        first_name=current_user.get("first_name", ""),
-        last_name=current_user.get("last_name", ""),
-        last_login=current_user.get("last_login")
+        user_id=current_user.user_id,
+        email=current_user.email,
+        username=extra_claims.get("username", ""),
+        first_name=extra_claims.get("first_name", ""),
+        last_name=extra_claims.get("last_name", ""),
+        last_login=extra_claims.get("last_login")
     )
 
 
@@ -350,20 +352,20 @@ async def get_profile(
     description="Validate if an access token is valid and not expired"
 )
 async def validate_token(
-    current_user: Dict[str, Any] = Depends(require_auth)
+    current_user: UserContext = Depends(require_auth)
 ) -> Dict[str, Any]:
     """
     Validate the current access token.
-    
+
     This endpoint can be used by other services to validate tokens
     without needing to implement JWT validation themselves.
     """
     return {
         "valid": True,
-        "user_id": current_user["user_id"],
-        "email": current_user["email"],
-        "expires_at": current_user.get("expires_at"),
-        "issued_at": current_user.get("issued_at")
+        "user_id": current_user.user_id,
+        "email": current_user.email,
+        "expires_at": current_user.expires_at,
+        "issued_at": current_user.issued_at
     }
 
 
@@ -14,18 +14,21 @@ from typing import List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query, Path, Body, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from models.task import (
     TaskCreateRequest, 
     TaskUpdateRequest, 
     TaskQueryParams,
-    TaskResponse, 
+    TaskResponse,
     TaskListResponse,
-    TaskStatus
+    TaskStatus,
+    TaskPriority,
+    TaskCategory
 )
 from services.task_service import TaskService
 from api.middleware.authentication import require_auth, get_current_user_id
+from infrastructure.database.connection import get_request_session
 from core.exceptions import (
     TaskNotFoundError, 
     ValidationError, 
@@ -35,8 +38,14 @@ from core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
-# Create router
-router = APIRouter(prefix="/tasks", tags=["Tasks"])
+# Create router. The session dependency pins one database session per
+# request, so every service call inside a handler shares a single pool
+# connection and transaction.
+router = APIRouter(
+    prefix="/tasks",
+    tags=["Tasks"],
+    dependencies=[Depends(get_request_session)]
+)
 
 # Dependency injection
 def get_task_service() -> TaskService:
@@ -124,11 +133,21 @@ async def get_tasks(
     
     Returns paginated results with metadata including total count and summary statistics.
     """
+    # Checks previously done by the TaskQueryParams validator chain
+    if start_date and end_date and end_date <= start_date:
+        raise ValidationError("End date must be after start date")
+
+    try:
+        priority_filter = TaskPriority(priority) if priority is not None else None
+        category_filter = TaskCategory(category) if category is not None else None
+    except ValueError as e:
+        raise ValidationError(str(e))
+
     # Build query parameters
     params = TaskQueryParams(
         status=status,
-        priority=priority,
-        category=category,
+        priority=priority_filter,
+        category=category_filter,
         name_contains=name_contains,
         start_date=start_date,
         end_date=end_date,
@@ -143,6 +162,66 @@ async def get_tasks(
     return tasks
 
 
+@router.get(
+    "/stream",
+    summary="Stream tasks as NDJSON",
+    description="Stream all matching tasks without pagination, one JSON object per line"
+)
+async def stream_tasks(
+    # Filtering parameters (same as GET /tasks, minus pagination)
+    status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
+    priority: Optional[int] = Query(None, ge=1, le=5, description="Filter by priority level"),
+    category: Optional[str] = Query(None, description="Filter by task category"),
+    name_contains: Optional[str] = Query(None, max_length=100, description="Filter by task name substring"),
+
+    # Date range filtering
+    start_date: Optional[datetime] = Query(None, description="Filter tasks starting after this date"),
+    end_date: Optional[datetime] = Query(None, description="Filter tasks ending before this date"),
+
+    # Sorting
+    sort_by: str = Query("start_time", description="Field to sort by"),
+    sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+
+    # Dependencies
+    user_id: str = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+) -> StreamingResponse:
+    """
+    Stream every matching task for the authenticated user as NDJSON.
+
+    Rows come off a server-side cursor and are written to the response as
+    they arrive, so exports of any size run in constant memory on both the
+    server and (for line-by-line consumers) the client. Supports the same
+    filters as GET /tasks; pagination does not apply.
+    """
+    if start_date and end_date and end_date <= start_date:
+        raise ValidationError("End date must be after start date")
+
+    try:
+        priority_filter = TaskPriority(priority) if priority is not None else None
+        category_filter = TaskCategory(category) if category is not None else None
+    except ValueError as e:
+        raise ValidationError(str(e))
+
+    params = TaskQueryParams(
+        status=status,
+        priority=priority_filter,
+        category=category_filter,
+        name_contains=name_contains,
+        start_date=start_date,
+        end_date=end_date,
+        sort_by=sort_by,
+        sort_order=sort_order
+    )
+
+    async def ndjson_lines():
+        async for task in task_service.stream_tasks(user_id, params):
+            yield task.model_dump_json().encode() + b"\n"
+
+    logger.debug(f"Streaming tasks for user {user_id}")
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
@@ -358,6 +437,38 @@ async def get_task_statistics(
 
 # Bulk Operations
 
+@router.post(
+    "/bulk/create",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk create tasks",
+    description="Create multiple tasks in a single operation"
+)
+async def bulk_create_tasks(
+    task_requests: List[TaskCreateRequest] = Body(..., description="Task creation data for each task"),
+    user_id: str = Depends(get_current_user_id),
+    task_service: TaskService = Depends(get_task_service)
+) -> List[TaskResponse]:
+    """
+    Create multiple tasks for the authenticated user in one operation.
+
+    The whole batch is validated for schedule conflicts — against existing
+    tasks and against the other tasks in the batch — before a single
+    multi-row insert. On any conflict the entire batch is rejected.
+    """
+    try:
+        created_tasks = await task_service.bulk_create_tasks(user_id, task_requests)
+        logger.info(f"Bulk create: {len(created_tasks)} tasks created for user {user_id}")
+        return created_tasks
+
+    except ScheduleConflictError as e:
+        logger.warning(f"Bulk create failed - schedule conflict: {e.message}")
+        raise
+    except ValidationError as e:
+        logger.warning(f"Bulk create failed - validation: {e.message}")
+        raise
+
+
 @router.patch(
     "/bulk/status",
     response_model=List[TaskResponse],
@@ -23,7 +23,7 @@ from core.exceptions import (
     InvalidTokenError,
     RateLimitExceededError
 )
-from services.auth_service import AuthService
+from services.auth_service import AuthService, UserContext
 from core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -77,15 +77,15 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             
             # Inject user context into request state
             request.state.user = user_context
-            request.state.user_id = user_context["user_id"]
+            request.state.user_id = user_context.user_id
             request.state.is_authenticated = True
-            
+
             # Check rate limits for authenticated user
-            await self._check_rate_limits(request, user_context["user_id"])
-            
+            await self._check_rate_limits(request, user_context.user_id)
+
             # Log successful authentication
             logger.debug(
-                f"Authenticated request - User: {user_context['user_id']} - "
+                f"Authenticated request - User: {user_context.user_id} - "
                 f"Path: {request.url.path} - "
                 f"Request ID: {getattr(request.state, 'request_id', 'unknown')}"
             )
@@ -124,12 +124,12 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         
         return False
     
-    async def _authenticate_request(self, request: Request) -> dict:
+    async def _authenticate_request(self, request: Request) -> UserContext:
         """
         Extract token from request and validate it.
-        
+
         Returns:
-            dict: User context with user_id, email, etc.
+            UserContext: User context with user_id, email, etc.
         """
         # Extract token from Authorization header
         token = await self._extract_token(request)
@@ -229,10 +229,10 @@ class OptionalAuthenticationMiddleware(AuthenticationMiddleware):
             
             # Inject user context
             request.state.user = user_context
-            request.state.user_id = user_context["user_id"]
+            request.state.user_id = user_context.user_id
             request.state.is_authenticated = True
-            
-            logger.debug(f"Optional auth successful - User: {user_context['user_id']}")
+
+            logger.debug(f"Optional auth successful - User: {user_context.user_id}")
             
         except (AuthenticationError, TokenExpiredError, InvalidTokenError):
             # Authentication failed, but continue without user context
@@ -253,18 +253,18 @@ class OptionalAuthenticationMiddleware(AuthenticationMiddleware):
 
 
 # Dependency for route-level authentication
-async def require_auth(request: Request) -> dict:
+async def require_auth(request: Request) -> UserContext:
     """
     FastAPI dependency that requires authentication.
-    
+
     Usage:
         @app.get("/protected")
-        async def protected_route(user: dict = Depends(require_auth)):
-            return {"user_id": user["user_id"]}
-    
+        async def protected_route(user: UserContext = Depends(require_auth)):
+            return {"user_id": user.user_id}
+
     Returns:
-        dict: User context
-        
+        UserContext: User context
+
     Raises:
         AuthenticationError: If user is not authenticated
     """
@@ -274,19 +274,19 @@ async def require_auth(request: Request) -> dict:
     return request.state.user
 
 
-async def get_current_user(request: Request) -> Optional[dict]:
+async def get_current_user(request: Request) -> Optional[UserContext]:
     """
     FastAPI dependency that returns current user if authenticated.
-    
+
     Usage:
         @app.get("/profile")
-        async def profile(user: Optional[dict] = Depends(get_current_user)):
+        async def profile(user: Optional[UserContext] = Depends(get_current_user)):
             if user:
-                return {"message": f"Hello {user['email']}"}
+                return {"message": f"Hello {user.email}"}
             return {"message": "Hello anonymous user"}
-    
+
     Returns:
-        dict or None: User context if authenticated, None otherwise
+        UserContext or None: User context if authenticated, None otherwise
     """
     if getattr(request.state, 'is_authenticated', False):
         return request.state.user
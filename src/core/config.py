@@ -82,6 +82,17 @@ class JWTSettings(BaseSettings):
     algorithm: str = Field("HS256", env="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(30, env="JWT_ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(7, env="JWT_REFRESH_TOKEN_EXPIRE_DAYS")
+
+    # Ed25519 keypair, only used when algorithm is "EdDSA"
+    ed25519_private_key_path: Optional[str] = Field(None, env="JWT_ED25519_PRIVATE_KEY_PATH")
+    ed25519_public_key_path: Optional[str] = Field(None, env="JWT_ED25519_PUBLIC_KEY_PATH")
+
+    # bcrypt work factor for password hashing
+    bcrypt_cost: int = Field(12, env="BCRYPT_COST")
+
+    # Access-token validation cache (0 TTL disables caching)
+    token_cache_ttl_seconds: int = Field(5, env="JWT_TOKEN_CACHE_TTL_SECONDS")
+    token_cache_max_size: int = Field(10000, env="JWT_TOKEN_CACHE_MAX_SIZE")
     
     @field_validator('secret_key', 'refresh_secret_key')
     @classmethod
@@ -11,18 +11,29 @@ This module provides:
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from uuid import uuid4
+from typing import AsyncIterator, Final, List, Optional, Dict, Any, Tuple
 
 from sqlalchemy import text, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from models.task import Task, TaskQueryParams, TaskStatus
+from models.task import Task, TaskQueryParams, TaskStatus, uuid7
 from core.exceptions import TaskNotFoundError, DatabaseError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Domain field name -> tasks column for partial updates
+_UPDATE_COLUMN_MAP: Final[Dict[str, str]] = {
+    "name": "task_name",
+    "description": "task_description",
+    "start_time": "start_time",
+    "end_time": "end_time",
+    "color": "color",
+    "status": "status",
+    "priority": "priority",
+    "category": "category",
+}
+
 
 class ITaskRepository(ABC):
     """
@@ -48,6 +59,22 @@ class ITaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def bulk_create(self, tasks: List[Task]) -> List[Task]:
+        """
+        Create multiple tasks in one statement.
+
+        Args:
+            tasks: Task domain models to create (IDs already assigned)
+
+        Returns:
+            List of created tasks in insertion order
+
+        Raises:
+            DatabaseError: If creation fails
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: str, task_id: str) -> Optional[Task]:
         """
@@ -82,6 +109,23 @@ class ITaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_all(self, user_id: str, params: TaskQueryParams) -> AsyncIterator[Task]:
+        """
+        Iterate over a user's tasks without buffering the full result set.
+
+        Args:
+            user_id: User ID to get tasks for
+            params: Query parameters for filtering and sorting
+
+        Yields:
+            Tasks matching the filters, one at a time from a server-side cursor
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         """
@@ -99,6 +143,29 @@ class ITaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def update_fields(
+        self,
+        user_id: str,
+        task_id: str,
+        values: Dict[str, Any]
+    ) -> Optional[Task]:
+        """
+        Update selected task fields in a single statement.
+
+        Args:
+            user_id: User ID who owns the task
+            task_id: Task ID to update
+            values: Field-name -> new-value mapping (domain field names)
+
+        Returns:
+            The updated task, or None if the task doesn't exist
+
+        Raises:
+            DatabaseError: If update fails
+        """
+        pass
+
     @abstractmethod
     async def delete(self, user_id: str, task_id: str) -> bool:
         """
@@ -141,6 +208,51 @@ class ITaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def check_first_conflict(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_task_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the ID of one task conflicting with the given range, if any.
+
+        Args:
+            user_id: User ID to check conflicts for
+            start_time: Start time of the proposed task
+            end_time: End time of the proposed task
+            exclude_task_id: Task ID to exclude from conflict check
+
+        Returns:
+            A conflicting task's ID, or None if the slot is free
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_active_schedule(
+        self,
+        user_id: str
+    ) -> List[Tuple[str, datetime, datetime]]:
+        """
+        Get the (task_id, start_time, end_time) triples of a user's
+        active tasks, for in-memory conflict probing.
+
+        Args:
+            user_id: User ID to load the schedule for
+
+        Returns:
+            List of (task_id, start_time, end_time) for all active tasks
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
     @abstractmethod
     async def get_overdue_tasks(self, user_id: str) -> List[Task]:
         """
@@ -180,11 +292,72 @@ class ITaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_task_statistics_with_week(
+        self,
+        user_id: str,
+        week_start: datetime,
+        week_end: datetime
+    ) -> Dict[str, Any]:
+        """
+        Get aggregate task statistics, including this-week counts, in one query.
+
+        Args:
+            user_id: User ID to aggregate tasks for
+            week_start: Start of the current week
+            week_end: End of the current week
+
+        Returns:
+            Dict with per-status counts, overdue count and this-week totals
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_latest_task_update(self, user_id: str) -> Optional[datetime]:
+        """
+        Get the most recent updated_at across a user's tasks.
+
+        Args:
+            user_id: User ID to check
+
+        Returns:
+            The latest updated_at timestamp, or None if the user has no tasks
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_task_statuses(
+        self,
+        user_id: str,
+        task_ids: List[str]
+    ) -> Dict[str, TaskStatus]:
+        """
+        Get current statuses for multiple tasks in one query.
+
+        Args:
+            user_id: User ID who owns the tasks
+            task_ids: List of task IDs to look up
+
+        Returns:
+            Dict mapping task_id to its current status; missing tasks
+            are simply absent from the dict
+
+        Raises:
+            DatabaseError: If query fails
+        """
+        pass
+
     @abstractmethod
     async def bulk_update_status(
-        self, 
-        user_id: str, 
-        task_ids: List[str], 
+        self,
+        user_id: str,
+        task_ids: List[str],
         new_status: TaskStatus
     ) -> List[Task]:
         """
@@ -236,7 +409,7 @@ class SQLAlchemyTaskRepository(ITaskRepository):
         """Create a new task in the database."""
         try:
             if not task.id:
-                task.id = str(uuid4())
+                task.id = str(uuid7())
             
             task.created_at = datetime.now()
             task.updated_at = task.created_at
@@ -261,7 +434,56 @@ class SQLAlchemyTaskRepository(ITaskRepository):
         except SQLAlchemyError as e:
             logger.error(f"Failed to create task: {e}")
             raise DatabaseError(f"Task creation failed: {e}")
-    
+
+    async def bulk_create(self, tasks: List[Task]) -> List[Task]:
+        """Create multiple tasks with a single multi-row INSERT.
+
+        One statement means one round-trip and one set-oriented index
+        update instead of a write per task.
+        """
+        try:
+            if not tasks:
+                return []
+
+            now = datetime.now()
+            values_rows = []
+            query_params: Dict[str, Any] = {}
+
+            for i, task in enumerate(tasks):
+                if not task.id:
+                    task.id = str(uuid7())
+                task.created_at = now
+                task.updated_at = now
+
+                values_rows.append(
+                    f"(:taskid_{i}, :userid_{i}, :task_name_{i}, "
+                    f":task_description_{i}, :start_time_{i}, :end_time_{i}, "
+                    f":color_{i}, :status_{i}, :priority_{i}, :category_{i}, "
+                    f":created_at_{i}, :updated_at_{i})"
+                )
+                for column, value in task.to_dict().items():
+                    query_params[f"{column}_{i}"] = value
+
+            values_clause = ",\n                    ".join(values_rows)
+
+            query = text(f"""
+                INSERT INTO tasks (
+                    taskid, userid, task_name, task_description,
+                    start_time, end_time, color, status, priority, category,
+                    created_at, updated_at
+                ) VALUES {values_clause}
+            """)
+
+            await self.session.execute(query, query_params)
+
+            logger.debug(f"Bulk created {len(tasks)} tasks")
+            return tasks
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to bulk create tasks: {e}")
+            raise DatabaseError(f"Bulk task creation failed: {e}")
+
+
     async def get_by_id(self, user_id: str, task_id: str) -> Optional[Task]:
         """Get a task by ID for a specific user."""
         try:
@@ -288,38 +510,56 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             logger.error(f"Failed to get task {task_id}: {e}")
             raise DatabaseError(f"Failed to retrieve task: {e}")
     
+    @staticmethod
+    def _build_filters(user_id: str, params: TaskQueryParams) -> Tuple[str, Dict[str, Any]]:
+        """Build the WHERE clause and bind params shared by the list queries."""
+        where_conditions = ["userid = :user_id"]
+        query_params: Dict[str, Any] = {"user_id": user_id}
+
+        if params.status:
+            where_conditions.append("status = :status")
+            query_params["status"] = params.status.value
+
+        if params.priority:
+            where_conditions.append("priority = :priority")
+            query_params["priority"] = params.priority.value
+
+        if params.category:
+            where_conditions.append("category = :category")
+            query_params["category"] = params.category.value
+
+        if params.name_contains:
+            where_conditions.append("task_name ILIKE :name_pattern")
+            query_params["name_pattern"] = f"%{params.name_contains}%"
+
+        if params.start_date:
+            where_conditions.append("end_time >= :start_date")
+            query_params["start_date"] = params.start_date
+
+        if params.end_date:
+            where_conditions.append("start_time <= :end_date")
+            query_params["end_date"] = params.end_date
+
+        return " AND ".join(where_conditions), query_params
+
+    @staticmethod
+    def _build_order_by(params: TaskQueryParams) -> str:
+        """Build a whitelisted ORDER BY clause from the query params."""
+        order_direction = "ASC" if params.sort_order == "asc" else "DESC"
+
+        valid_sort_fields = {
+            "start_time", "end_time", "task_name", "status",
+            "priority", "category", "created_at", "updated_at"
+        }
+        sort_field = params.sort_by if params.sort_by in valid_sort_fields else "start_time"
+
+        return f"{sort_field} {order_direction}"
+
     async def get_by_user(self, user_id: str, params: TaskQueryParams) -> tuple[List[Task], int]:
         """Get tasks for a user with filtering and pagination."""
         try:
-            where_conditions = ["userid = :user_id"]
-            query_params = {"user_id": user_id}
-            
-            if params.status:
-                where_conditions.append("status = :status")
-                query_params["status"] = params.status.value
-            
-            if params.priority:
-                where_conditions.append("priority = :priority")
-                query_params["priority"] = params.priority.value
-            
-            if params.category:
-                where_conditions.append("category = :category")
-                query_params["category"] = params.category.value
-            
-            if params.name_contains:
-                where_conditions.append("task_name ILIKE :name_pattern")
-                query_params["name_pattern"] = f"%{params.name_contains}%"
-            
-            if params.start_date:
-                where_conditions.append("end_time >= :start_date")
-                query_params["start_date"] = params.start_date
-            
-            if params.end_date:
-                where_conditions.append("start_time <= :end_date")
-                query_params["end_date"] = params.end_date
-            
-            where_clause = " AND ".join(where_conditions)
-            
+            where_clause, query_params = self._build_filters(user_id, params)
+
             count_query = text(f"""
                 SELECT COUNT(*) as total
                 FROM tasks
@@ -328,22 +568,14 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             
             count_result = await self.session.execute(count_query, query_params)
             total_count = count_result.fetchone()[0]
-            
-            order_direction = "ASC" if params.sort_order == "asc" else "DESC"
-            
-            valid_sort_fields = {
-                "start_time", "end_time", "task_name", "status", 
-                "priority", "category", "created_at", "updated_at"
-            }
-            sort_field = params.sort_by if params.sort_by in valid_sort_fields else "start_time"
-            
+
             main_query = text(f"""
                 SELECT taskid, userid, task_name, task_description,
                        start_time, end_time, color, status, priority, category,
                        created_at, updated_at
                 FROM tasks
                 WHERE {where_clause}
-                ORDER BY {sort_field} {order_direction}
+                ORDER BY {self._build_order_by(params)}
                 LIMIT :limit OFFSET :offset
             """)
             
@@ -363,7 +595,35 @@ class SQLAlchemyTaskRepository(ITaskRepository):
         except SQLAlchemyError as e:
             logger.error(f"Failed to get tasks for user {user_id}: {e}")
             raise DatabaseError(f"Failed to retrieve tasks: {e}")
-    
+
+    async def iter_all(self, user_id: str, params: TaskQueryParams) -> AsyncIterator[Task]:
+        """Iterate over a user's tasks via a server-side cursor.
+
+        session.stream() keeps the result on the server and fetches rows
+        in driver-sized batches, so memory stays flat no matter how many
+        tasks match. Pagination params are ignored: streaming exists for
+        the unbounded export case.
+        """
+        try:
+            where_clause, query_params = self._build_filters(user_id, params)
+
+            query = text(f"""
+                SELECT taskid, userid, task_name, task_description,
+                       start_time, end_time, color, status, priority, category,
+                       created_at, updated_at
+                FROM tasks
+                WHERE {where_clause}
+                ORDER BY {self._build_order_by(params)}
+            """)
+
+            result = await self.session.stream(query, query_params)
+            async for row in result:
+                yield Task.from_dict(row._asdict())
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to stream tasks for user {user_id}: {e}")
+            raise DatabaseError(f"Failed to stream tasks: {e}")
+
     async def update(self, task: Task) -> Task:
         """Update an existing task."""
         try:
@@ -395,6 +655,55 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             logger.error(f"Failed to update task {task.id}: {e}")
             raise DatabaseError(f"Task update failed: {e}")
     
+    async def update_fields(
+        self,
+        user_id: str,
+        task_id: str,
+        values: Dict[str, Any]
+    ) -> Optional[Task]:
+        """Update selected task fields in a single statement.
+
+        UPDATE ... RETURNING folds the existence check into the write, so
+        a partial update is one round-trip; None means no such task.
+        """
+        try:
+            set_clauses = []
+            query_params = {"task_id": task_id, "user_id": user_id}
+
+            for field, value in values.items():
+                column = _UPDATE_COLUMN_MAP.get(field)
+                if column is None:
+                    continue
+                set_clauses.append(f"{column} = :{column}")
+                query_params[column] = value
+
+            if not set_clauses:
+                return await self.get_by_id(user_id, task_id)
+
+            set_clauses.append("updated_at = NOW()")
+
+            query = text(f"""
+                UPDATE tasks SET
+                    {", ".join(set_clauses)}
+                WHERE taskid = :task_id AND userid = :user_id
+                RETURNING taskid, userid, task_name, task_description,
+                          start_time, end_time, color, status, priority, category,
+                          created_at, updated_at
+            """)
+
+            result = await self.session.execute(query, query_params)
+            row = result.fetchone()
+
+            if not row:
+                return None
+
+            logger.debug(f"Task fields updated in database: {task_id}")
+            return Task.from_dict(row._asdict())
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to update task {task_id}: {e}")
+            raise DatabaseError(f"Task update failed: {e}")
+
     async def delete(self, user_id: str, task_id: str) -> bool:
         """Delete a task."""
         try:
@@ -467,6 +776,87 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             logger.error(f"Failed to get conflicting tasks: {e}")
             raise DatabaseError(f"Failed to check conflicts: {e}")
     
+    async def check_first_conflict(
+        self,
+        user_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_task_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Get the ID of one conflicting task, or None if the slot is free.
+
+        Validators only need a yes/no plus an ID for the error message,
+        so LIMIT 1 on a single column lets the range index stop at the
+        first match with no row hydration.
+        """
+        try:
+            where_conditions = [
+                "userid = :user_id",
+                "status IN ('pending', 'in_progress', 'blocked')",
+                "tstzrange(start_time, end_time, '[)')"
+                " && tstzrange(:start_time, :end_time, '[)')"
+            ]
+
+            query_params = {
+                "user_id": user_id,
+                "start_time": start_time,
+                "end_time": end_time
+            }
+
+            if exclude_task_id:
+                where_conditions.append("taskid != :exclude_task_id")
+                query_params["exclude_task_id"] = exclude_task_id
+
+            query = text(f"""
+                SELECT taskid
+                FROM tasks
+                WHERE {" AND ".join(where_conditions)}
+                LIMIT 1
+            """)
+
+            result = await self.session.execute(query, query_params)
+            row = result.fetchone()
+
+            return str(row.taskid) if row else None
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to check first conflict: {e}")
+            raise DatabaseError(f"Failed to check conflicts: {e}")
+
+    async def get_active_schedule(
+        self,
+        user_id: str
+    ) -> List[Tuple[str, datetime, datetime]]:
+        """Get a user's active task time ranges for in-memory probing.
+
+        Only three columns come back, so even a dense schedule loads in
+        one cheap round-trip. Covers every active task, with no time
+        bound, so probes against this set agree exactly with
+        check_first_conflict.
+        """
+        try:
+            query = text("""
+                SELECT taskid, start_time, end_time
+                FROM tasks
+                WHERE userid = :user_id
+                    AND status IN ('pending', 'in_progress', 'blocked')
+                ORDER BY start_time
+            """)
+
+            result = await self.session.execute(query, {"user_id": user_id})
+            rows = result.fetchall()
+
+            schedule = [
+                (str(row.taskid), row.start_time, row.end_time) for row in rows
+            ]
+
+            logger.debug(f"Loaded {len(schedule)} active intervals for user {user_id}")
+            return schedule
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to load active schedule: {e}")
+            raise DatabaseError(f"Failed to load active schedule: {e}")
+
     async def get_overdue_tasks(self, user_id: str) -> List[Task]:
         """Get all overdue tasks for a user."""
         try:
@@ -528,75 +918,175 @@ class SQLAlchemyTaskRepository(ITaskRepository):
             logger.error(f"Failed to get tasks in date range: {e}")
             raise DatabaseError(f"Failed to retrieve tasks in date range: {e}")
     
+    async def get_task_statistics_with_week(
+        self,
+        user_id: str,
+        week_start: datetime,
+        week_end: datetime
+    ) -> Dict[str, Any]:
+        """Get aggregate task statistics in a single table scan."""
+        try:
+            # Conditional aggregates let the DB produce every counter in
+            # one pass instead of hydrating rows for Python-side counting
+            query = text("""
+                SELECT
+                    COUNT(*) AS total_tasks,
+                    COUNT(*) FILTER (WHERE status = 'pending') AS pending_tasks,
+                    COUNT(*) FILTER (WHERE status = 'in_progress') AS in_progress_tasks,
+                    COUNT(*) FILTER (WHERE status = 'completed') AS completed_tasks,
+                    COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_tasks,
+                    COUNT(*) FILTER (WHERE status = 'blocked') AS blocked_tasks,
+                    COUNT(*) FILTER (
+                        WHERE status IN ('pending', 'in_progress', 'blocked')
+                            AND end_time < NOW()
+                    ) AS overdue_tasks,
+                    COUNT(*) FILTER (
+                        WHERE start_time >= :week_start AND start_time <= :week_end
+                    ) AS this_week_tasks,
+                    COUNT(*) FILTER (
+                        WHERE start_time >= :week_start AND start_time <= :week_end
+                            AND status = 'completed'
+                    ) AS this_week_completed
+                FROM tasks
+                WHERE userid = :user_id
+            """)
+
+            result = await self.session.execute(query, {
+                "user_id": user_id,
+                "week_start": week_start,
+                "week_end": week_end
+            })
+            row = result.fetchone()
+
+            return dict(row._mapping)
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get task statistics: {e}")
+            raise DatabaseError(f"Failed to retrieve task statistics: {e}")
+
+    async def get_latest_task_update(self, user_id: str) -> Optional[datetime]:
+        """Get the most recent updated_at across a user's tasks.
+
+        Serves as a cheap change marker for cache validation: an index on
+        (userid, updated_at) turns MAX() into a single index probe.
+        """
+        try:
+            query = text("""
+                SELECT MAX(updated_at) AS latest
+                FROM tasks
+                WHERE userid = :user_id
+            """)
+
+            result = await self.session.execute(query, {"user_id": user_id})
+            row = result.fetchone()
+
+            return row.latest if row else None
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get latest task update: {e}")
+            raise DatabaseError(f"Failed to get latest task update: {e}")
+
+    async def get_task_statuses(
+        self,
+        user_id: str,
+        task_ids: List[str]
+    ) -> Dict[str, TaskStatus]:
+        """Get current statuses for multiple tasks in one query."""
+        try:
+            if not task_ids:
+                return {}
+
+            placeholders = ",".join([f":task_id_{i}" for i in range(len(task_ids))])
+            query_params = {"user_id": user_id}
+
+            for i, task_id in enumerate(task_ids):
+                query_params[f"task_id_{i}"] = task_id
+
+            query = text(f"""
+                SELECT taskid, status
+                FROM tasks
+                WHERE userid = :user_id
+                    AND taskid IN ({placeholders})
+            """)
+
+            result = await self.session.execute(query, query_params)
+            rows = result.fetchall()
+
+            return {str(row.taskid): TaskStatus(row.status) for row in rows}
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get task statuses: {e}")
+            raise DatabaseError(f"Failed to retrieve task statuses: {e}")
+
     async def bulk_update_status(
-        self, 
-        user_id: str, 
-        task_ids: List[str], 
+        self,
+        user_id: str,
+        task_ids: List[str],
         new_status: TaskStatus
     ) -> List[Task]:
-        """Update status for multiple tasks."""
+        """Update status for multiple tasks in a single statement."""
         try:
             if not task_ids:
                 return []
-            
+
             placeholders = ",".join([f":task_id_{i}" for i in range(len(task_ids))])
             query_params = {"user_id": user_id, "new_status": new_status.value}
-            
+
             for i, task_id in enumerate(task_ids):
                 query_params[f"task_id_{i}"] = task_id
-            
+
+            # RETURNING hands back the updated rows, so there is no
+            # follow-up SELECT round-trip
             update_query = text(f"""
                 UPDATE tasks SET
                     status = :new_status,
                     updated_at = NOW()
                 WHERE userid = :user_id
                     AND taskid IN ({placeholders})
+                RETURNING taskid, userid, task_name, task_description,
+                          start_time, end_time, color, status, priority, category,
+                          created_at, updated_at
             """)
-            
-            await self.session.execute(update_query, query_params)
-            
-            select_query = text(f"""
-                SELECT taskid, userid, task_name, task_description,
-                       start_time, end_time, color, status, priority, category,
-                       created_at, updated_at
-                FROM tasks
-                WHERE userid = :user_id
-                    AND taskid IN ({placeholders})
-            """)
-            
-            result = await self.session.execute(select_query, query_params)
+
+            result = await self.session.execute(update_query, query_params)
             rows = result.fetchall()
-            
+
             tasks = [Task.from_dict(row._asdict()) for row in rows]
-            
+
             logger.debug(f"Bulk updated {len(tasks)} tasks to status {new_status.value}")
             return tasks
-            
+
         except SQLAlchemyError as e:
             logger.error(f"Failed to bulk update task status: {e}")
             raise DatabaseError(f"Bulk status update failed: {e}")
-    
+
     async def bulk_delete(self, user_id: str, task_ids: List[str]) -> Dict[str, bool]:
-        """Delete multiple tasks."""
+        """Delete multiple tasks in a single statement."""
         try:
             if not task_ids:
                 return {}
-            
-            results = {}
-                
-            for task_id in task_ids:
-                try:
-                    deleted = await self.delete(user_id, task_id)
-                    results[task_id] = deleted
-                except Exception as e:
-                    logger.warning(f"Failed to delete task {task_id}: {e}")
-                    results[task_id] = False
-            
-            success_count = sum(1 for success in results.values() if success)
-            logger.debug(f"Bulk deleted {success_count}/{len(task_ids)} tasks")
-            
+
+            placeholders = ",".join([f":task_id_{i}" for i in range(len(task_ids))])
+            query_params = {"user_id": user_id}
+
+            for i, task_id in enumerate(task_ids):
+                query_params[f"task_id_{i}"] = task_id
+
+            delete_query = text(f"""
+                DELETE FROM tasks
+                WHERE userid = :user_id
+                    AND taskid IN ({placeholders})
+                RETURNING taskid
+            """)
+
+            result = await self.session.execute(delete_query, query_params)
+            deleted_ids = {str(row.taskid) for row in result.fetchall()}
+
+            results = {task_id: task_id in deleted_ids for task_id in task_ids}
+
+            logger.debug(f"Bulk deleted {len(deleted_ids)}/{len(task_ids)} tasks")
             return results
-            
-        except Exception as e:
+
+        except SQLAlchemyError as e:
             logger.error(f"Failed to bulk delete tasks: {e}")
             raise DatabaseError(f"Bulk delete failed: {e}") 
\ No newline at end of file
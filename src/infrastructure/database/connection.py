@@ -10,6 +10,7 @@ This module provides:
 
 import logging
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import AsyncGenerator, Optional
 
 import asyncpg
@@ -24,7 +25,7 @@ from sqlalchemy import text, event
 from sqlalchemy.exc import SQLAlchemyError
 
 from core.config import settings
-from core.exceptions import DatabaseError
+from core.exceptions import BaseTimeNestException, DatabaseError
 
 logger = logging.getLogger(__name__)
 
@@ -136,13 +137,24 @@ class DatabaseManager:
         try:
             yield session
             await session.commit()
+        except BaseTimeNestException:
+            # Domain errors (not-found, conflicts, validation) carry their
+            # own HTTP mapping; roll back but don't disguise them as
+            # database failures
+            await session.rollback()
+            raise
         except Exception as e:
             await session.rollback()
             logger.error(f"Database session error: {e}")
             raise DatabaseError(f"Database operation failed: {e}")
         finally:
             await session.close()
-    
+
+    @property
+    def session_factory(self) -> Optional[async_sessionmaker]:
+        """Get the session factory"""
+        return self._session_factory
+
     @property
     def is_connected(self) -> bool:
         """Check if database is connected"""
@@ -158,19 +170,74 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
-# Dependency for FastAPI
+# Request-scoped session. When a request handler pins a session here (via the
+# get_request_session dependency), every get_db_session() call during that
+# request reuses it instead of checking out another pool connection.
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "request_session", default=None
+)
+
+
+@asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI dependency to get database session.
-    
-    Usage in route:
-        async def some_endpoint(db: AsyncSession = Depends(get_db_session)):
-            # Use db session here
+    Get a database session, reusing the request-scoped one when present.
+
+    Service code does `async with get_db_session() as session:`. Inside a
+    request that pinned a session via get_request_session, this yields the
+    shared session, so N service calls in one request cost one pool
+    checkout; each service call still commits its own work here, before
+    the handler returns, so the response never races the commit. Outside
+    a request (background tasks, scripts) it falls back to a fresh
+    session with the usual commit-on-success lifecycle.
     """
+    session = _request_session.get()
+    if session is not None:
+        try:
+            yield session
+            await session.commit()
+        except BaseTimeNestException:
+            await session.rollback()
+            raise
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error: {e}")
+            raise DatabaseError(f"Database operation failed: {e}")
+        return
+
     async with db_manager.get_session() as session:
         yield session
 
 
+# Dependency for FastAPI
+async def get_request_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency that pins one session for the whole request.
+
+    The session comes straight from the factory: commit/rollback belong
+    to the get_db_session blocks inside the handler, which run before
+    the response is sent. Teardown only unpins and closes — it must not
+    wrap handler exceptions, or domain errors would surface as 500s.
+
+    Usage:
+        router = APIRouter(dependencies=[Depends(get_request_session)])
+    """
+    factory = db_manager.session_factory
+    if factory is None:
+        raise DatabaseError("Database not initialized")
+
+    session = factory()
+    token = _request_session.set(session)
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        _request_session.reset(token)
+        await session.close()
+
+
 # Event handlers for connection monitoring
 @event.listens_for(QueuePool, "connect")
 def on_connect(dbapi_conn, connection_record):
@@ -1,12 +1,32 @@
+import time
+
 from fastapi import APIRouter, HTTPException
 from database.postgresdb import PostgresDB
 from config import settings
 
 router = APIRouter(prefix='/health_check', tags=["ping"])
 
+# The schema rarely changes, so readiness probes can reuse the cached table
+# list for a short window instead of querying information_schema every poll.
+_TABLES_CACHE_TTL_SECONDS = 30
+_tables_cache = (0.0, None)  # (monotonic timestamp, tables)
+
+
+def _list_tables():
+    global _tables_cache
+    ts, tables = _tables_cache
+    if tables is not None and time.monotonic() - ts < _TABLES_CACHE_TTL_SECONDS:
+        return tables
+    with PostgresDB() as db:
+        db.cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
+        tables = [row['table_name'] for row in db.cur.fetchall()]
+    _tables_cache = (time.monotonic(), tables)
+    return tables
+
 
 @router.get("/")
 def health_check():
+    # Liveness only: must never touch the database.
     return {
         "status":"ok"
     }
@@ -14,16 +34,14 @@ def health_check():
 @router.get("/postgres")
 def check_postgres():
     try:
-        with PostgresDB() as db:
-            db.cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
-            tables = [row['table_name'] for row in db.cur.fetchall()]
-            return {
-                "status": "connected",
-                "host": settings.postgres_client_url,
-                "port": settings.postgres_port,
-                "user": settings.postgres_user,
-                "database": "postgres",
-                "tables": tables
-            }
+        tables = _list_tables()
+        return {
+            "status": "connected",
+            "host": settings.postgres_client_url,
+            "port": settings.postgres_port,
+            "user": settings.postgres_user,
+            "database": "postgres",
+            "tables": tables
+        }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Postgres connection failed: {e}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Postgres connection failed: {e}")
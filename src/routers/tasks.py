@@ -1,4 +1,8 @@
+import json
+from datetime import date, datetime
+
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from database.postgresdb import PostgresDB
 from authorization.token_based import get_current_user
@@ -19,6 +23,9 @@ class Task(BaseModel):
     status: Optional[str] = None
     priority: Optional[int] = None
 
+class BulkDeleteRequest(BaseModel):
+    task_ids: List[str]
+
 class UpdateTask(BaseModel):
     task_name: Optional[str] = None
     task_description: Optional[str] = None
@@ -40,25 +47,53 @@ def create_task(task: Task, current_user = Depends(get_current_user)):
     raise HTTPException(status_code=400, detail="❌ Could not create task.")
 
 
+def _json_default(obj):
+    # Timestamps must stay ISO-8601 like FastAPI's encoder produced
+    # before streaming; plain str(datetime) uses a space separator that
+    # strict clients reject.
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _stream_user_tasks(user_id: str):
+    # The generator owns the connection: it stays open until the response
+    # body has been fully sent, then gets closed in the finally block.
+    db = PostgresDB()
+    try:
+        # Named (server-side) cursor fetches rows in batches instead of
+        # materializing the whole result set and JSON blob in memory.
+        yield b'{"userid": ' + json.dumps(user_id).encode() + b', "tasks": ['
+        try:
+            cur = db.conn.cursor(name=f"tasks_stream_{uuid4().hex}")
+            cur.itersize = 500
+            cur.execute("SELECT * FROM tasks WHERE userid = %s", (user_id,))
+            first = True
+            for row in cur:
+                chunk = json.dumps(dict(row), default=_json_default).encode()
+                yield chunk if first else b"," + chunk
+                first = False
+            cur.close()
+        except Exception as e:
+            # Match PostgresDB.execute error handling: log and return an
+            # empty result instead of breaking the response mid-stream.
+            print(f"❌ Query error: {e}")
+            db.conn.rollback()
+        yield b"]}"
+    finally:
+        db.close()
+
+
 @router.get("/tasks/{user_id}")
 def get_user_by_id(user_id: str,current_user = Depends(get_current_user)):
-    with PostgresDB() as db:
-        result = db.select("tasks", {"userid": user_id})
-    if result:
-        return {
-            "userid": user_id,
-            "tasks": result
-        }
-    else:
-        return {
-            "userid":user_id,
-            "tasks": []
-        }
+    return StreamingResponse(_stream_user_tasks(user_id), media_type="application/json")
 
 @router.put("/tasks/{user_id}/{task_id}")
 def update_task(user_id: str, task_id: str, task: UpdateTask, current_user = Depends(get_current_user)):
-    task_info = {k: v for k, v in task.dict().items() if v is not None}
-    
+    # Only fields the client actually sent: skips the build-then-filter pass
+    # over every field and keeps "field omitted" distinct from "field: null".
+    task_info = task.dict(exclude_unset=True)
+
     if not task_info:
         raise HTTPException(status_code=400, detail="❌ No fields to update provided.")
         
@@ -69,11 +104,17 @@ def update_task(user_id: str, task_id: str, task: UpdateTask, current_user = Dep
     raise HTTPException(status_code=404, detail="❌ Task not found.")
 
 
+# Keep these as static module-level strings so the driver and server can
+# reuse the prepared plan instead of re-parsing on every call.
+DELETE_TASK_QUERY = "DELETE FROM tasks WHERE userid = %s AND taskid = %s RETURNING *"
+BULK_DELETE_TASKS_QUERY = "DELETE FROM tasks WHERE userid = %s AND taskid = ANY(%s::uuid[]) RETURNING taskid"
+
+
 @router.delete("/tasks/{user_id}/{task_id}")
 def delete_task(user_id: str, task_id: str,current_user = Depends(get_current_user)):
     with PostgresDB() as db:
         result = db.execute(
-            "DELETE FROM tasks WHERE userid = %s AND taskid = %s RETURNING *",
+            DELETE_TASK_QUERY,
             (user_id, task_id),
             fetch_one=True,
             commit=True
@@ -84,6 +125,30 @@ def delete_task(user_id: str, task_id: str,current_user = Depends(get_current_us
     raise HTTPException(status_code=404, detail="❌ Task not found.")
 
 
+@router.delete("/tasks/{user_id}")
+def bulk_delete_tasks(user_id: str, request: BulkDeleteRequest, current_user = Depends(get_current_user)):
+    if not request.task_ids:
+        raise HTTPException(status_code=400, detail="❌ No task ids provided.")
+
+    # Single round-trip for the whole batch instead of one DELETE per task.
+    with PostgresDB() as db:
+        result = db.execute(
+            BULK_DELETE_TASKS_QUERY,
+            (user_id, request.task_ids),
+            fetch_all=True,
+            commit=True
+        )
+
+    deleted_ids = [row["taskid"] for row in result] if result else []
+    if deleted_ids:
+        return {
+            "message": "✅ Tasks deleted!",
+            "deleted": deleted_ids,
+            "count": len(deleted_ids)
+        }
+    raise HTTPException(status_code=404, detail="❌ No matching tasks found.")
+
+
 @router.get("/tasks/query/{user_id}")
 def query_tasks(
     user_id: str,
@@ -10,15 +10,26 @@ This service provides:
 - Security logging and monitoring
 """
 
+import asyncio
+import base64
+import hmac
+import json
 import logging
-from datetime import datetime, timedelta, timezone
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Tuple
 import hashlib
 import secrets
+import uuid
 from functools import lru_cache
 
 import jwt
-import bcrypt
+import redis.asyncio as aioredis
+from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
@@ -34,12 +45,215 @@ from infrastructure.database.connection import db_manager
 
 logger = logging.getLogger(__name__)
 
+# Statements constructed once at import time. SQLAlchemy caches the compiled
+# form keyed by statement identity, and asyncpg's prepared-statement cache is
+# keyed by the resulting SQL string, so reusing these objects avoids re-parse
+# and re-prepare on every auth operation.
+_USER_BY_EMAIL_QUERY = text("""
+    SELECT
+        userid, email, username, first_name, last_name,
+        password_hash, is_active, last_login, created_at
+    FROM users
+    WHERE email = :email
+""")
+
+_IDENTITY_CONFLICT_QUERY = text("""
+    SELECT email, username
+    FROM users
+    WHERE email = :email OR username = :username
+    LIMIT 2
+""")
+
+_CREATE_USER_QUERY = text("""
+    INSERT INTO users (
+        userid, email, username, first_name, last_name,
+        password_hash, is_active, created_at, last_login
+    ) VALUES (
+        :userid, :email, :username, :first_name, :last_name,
+        :password_hash, :is_active, :created_at, :last_login
+    )
+    ON CONFLICT DO NOTHING
+    RETURNING userid
+""")
+
+_UPDATE_LAST_LOGIN_QUERY = text("""
+    UPDATE users
+    SET last_login = :last_login
+    WHERE userid = :user_id
+""")
+
+# Dedicated pool for bcrypt work. Bounded to the CPU count so a login flood
+# queues instead of spawning an unbounded number of hashing threads.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="bcrypt"
+)
+
+# Strong references to fire-and-forget tasks. The event loop only keeps
+# weak references, so without these a pending task (e.g. the last-login
+# update) can be garbage-collected before it ever runs.
+_background_tasks: set = set()
+
+
+# HS256 fast path: PyJWT rebuilds the header, re-encodes the secret and
+# assembles intermediate objects on every call. These helpers do the same
+# JOSE steps with a precomputed header segment and a single OpenSSL-backed
+# HMAC, raising PyJWT exception types so callers keep their error handling.
+
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+
+
+def _jwt_json_default(value):
+    """Serialize datetimes as RFC 7519 NumericDate, like PyJWT does"""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    raise TypeError(f"Cannot serialize {type(value).__name__} in JWT payload")
+
+
+# Claims consumed into named UserContext fields; anything else lands in extra
+_STANDARD_CLAIMS = frozenset({"sub", "email", "iat", "exp", "type", "jti"})
+
+
+@dataclass(frozen=True, slots=True)
+class UserContext:
+    """Validated access-token claims.
+
+    A frozen slotted struct instead of a per-request dict: one allocation,
+    attribute access instead of hash lookups, and safe to share from the
+    token-validation cache because it cannot be mutated downstream.
+    """
+
+    user_id: str
+    email: str
+    jti: Optional[str] = None
+    issued_at: Optional[int] = None
+    expires_at: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = None
+
+
+# Character classes for password-strength checks. frozenset gives O(1)
+# membership instead of a linear scan over the literal.
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+# Local blacklist fallback sizing: 2^20 bits is 128 KB of filter, good for
+# roughly 100k JTIs at ~1% false-positive rate with 7 hash probes, and the
+# LRU bounds the exact-match store that resolves those false positives.
+_BLACKLIST_BLOOM_BITS = 1 << 20
+_BLACKLIST_LRU_MAX = 10_000
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter using SHA-256 double hashing.
+
+    Membership tests on a miss (the overwhelmingly common case for token
+    blacklists) touch only a handful of bits in a flat bytearray, so the
+    filter stays at constant memory regardless of how many JTIs are added.
+    False positives are possible; false negatives are not.
+    """
+
+    __slots__ = ("_bits", "_num_bits", "_num_hashes")
+
+    def __init__(self, num_bits: int = _BLACKLIST_BLOOM_BITS, num_hashes: int = 7):
+        self._bits = bytearray(num_bits // 8)
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+
+    def _bit_positions(self, item: str):
+        # Kirsch-Mitzenmacher: derive k indexes from two halves of one digest
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big")
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._bit_positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        for pos in self._bit_positions(item):
+            if not self._bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+def _encode_hs256(payload: Dict[str, Any], secret: bytes) -> str:
+    """Encode an HS256 JWT"""
+    payload_b64 = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":"), default=_jwt_json_default).encode()
+    ).rstrip(b"=")
+    signing_input = _HS256_HEADER_B64 + b"." + payload_b64
+    mac = hmac.new(secret, signing_input, hashlib.sha256).digest()
+    signature_b64 = base64.urlsafe_b64encode(mac).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode("ascii")
+
+
+def _decode_hs256(token: str, secret: bytes) -> Dict[str, Any]:
+    """Decode and verify an HS256 JWT, including the exp claim"""
+    try:
+        signing_input, _, signature_b64 = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+
+        mac = hmac.new(secret, signing_input, hashlib.sha256).digest()
+        if not hmac.compare_digest(mac, _b64url_decode(signature_b64)):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        header = json.loads(_b64url_decode(header_b64))
+        if header.get("alg") != "HS256":
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+        payload = json.loads(_b64url_decode(payload_b64))
+
+    except jwt.InvalidTokenError:
+        raise
+    except Exception:
+        raise jwt.DecodeError("Invalid token")
+
+    exp = payload.get("exp")
+    if exp is not None and time.time() >= float(exp):
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    return payload
+
 
 class AuthService:
     """
     Enhanced authentication service with JWT and security features.
     """
-    
+
+    # Slot storage keeps attribute reads on the token hot path a C-level
+    # offset lookup instead of a __dict__ hash probe
+    __slots__ = (
+        "jwt_secret",
+        "jwt_refresh_secret",
+        "jwt_algorithm",
+        "access_token_expire_minutes",
+        "refresh_token_expire_days",
+        "_access_ttl",
+        "_refresh_ttl",
+        "_pwd_ctx",
+        "_jwt_secret_bytes",
+        "_jwt_refresh_secret_bytes",
+        "_signing_key",
+        "_verify_key",
+        "_refresh_signing_key",
+        "_refresh_verify_key",
+        "_redis",
+        "_blacklist_bloom",
+        "_blacklist_lru",
+        "_token_cache_ttl",
+        "_token_cache_max_size",
+        "_token_cache",
+    )
+
     def __init__(self):
         self.jwt_secret = settings.jwt.secret_key
         self.jwt_refresh_secret = settings.jwt.refresh_secret_key
@@ -47,42 +261,116 @@ class AuthService:
         self.access_token_expire_minutes = settings.jwt.access_token_expire_minutes
         self.refresh_token_expire_days = settings.jwt.refresh_token_expire_days
 
-        # Token blacklist (in production, use Redis)
-        self._blacklisted_tokens = set()
+        # Token lifetimes in seconds, computed once instead of per token
+        self._access_ttl = self.access_token_expire_minutes * 60
+        self._refresh_ttl = self.refresh_token_expire_days * 86400
+
+        # Passlib caches the bcrypt handler, so per-call scheme setup happens
+        # once here instead of on every hash. Cost is tuned via BCRYPT_COST;
+        # "deprecated=auto" flags hashes made at a lower cost for rehashing.
+        self._pwd_ctx = CryptContext(
+            schemes=["bcrypt"],
+            bcrypt__rounds=settings.jwt.bcrypt_cost,
+            deprecated="auto"
+        )
+
+        # Encoded once; the HS256 fast path signs/verifies with these directly
+        self._jwt_secret_bytes = self.jwt_secret.encode('utf-8')
+        self._jwt_refresh_secret_bytes = self.jwt_refresh_secret.encode('utf-8')
+
+        # Keys for the PyJWT path. With EdDSA (Ed25519) one keypair signs
+        # both token types and verifiers only ever need the public key,
+        # which is the preferred setup for verify-heavy deployments.
+        if self.jwt_algorithm == "EdDSA":
+            self._signing_key = self._load_key_file(settings.jwt.ed25519_private_key_path)
+            self._verify_key = self._load_key_file(settings.jwt.ed25519_public_key_path)
+            self._refresh_signing_key = self._signing_key
+            self._refresh_verify_key = self._verify_key
+        else:
+            self._signing_key = self.jwt_secret
+            self._verify_key = self.jwt_secret
+            self._refresh_signing_key = self.jwt_refresh_secret
+            self._refresh_verify_key = self.jwt_refresh_secret
+
+        # Token blacklist: Redis keys with TTL equal to the token's remaining
+        # lifetime, so revocations are shared across workers and expire on
+        # their own. When Redis is down we fall back to a bounded local
+        # store: a Bloom filter answers the common "not revoked" case in
+        # constant time and memory, and a small LRU resolves the filter's
+        # false positives with exact matches.
+        self._redis: Optional[aioredis.Redis] = None
+        self._blacklist_bloom = _BloomFilter()
+        self._blacklist_lru: "OrderedDict[str, None]" = OrderedDict()
+
+        # Short-TTL cache of validated access tokens, keyed by SHA-256 of the
+        # token (never the raw token). A hit skips HMAC verification and JSON
+        # parsing for repeat requests carrying the same bearer token.
+        self._token_cache_ttl = settings.jwt.token_cache_ttl_seconds
+        self._token_cache_max_size = settings.jwt.token_cache_max_size
+        self._token_cache: "OrderedDict[bytes, Tuple[UserContext, float]]" = OrderedDict()
+
+    @staticmethod
+    def _load_key_file(path: Optional[str]) -> str:
+        """Load a PEM key file for asymmetric JWT signing"""
+        if not path:
+            raise AuthenticationError(
+                "EdDSA algorithm requires JWT_ED25519_PRIVATE_KEY_PATH and "
+                "JWT_ED25519_PUBLIC_KEY_PATH to be configured"
+            )
+        with open(path, "r") as f:
+            return f.read()
     
     # Password Management
     
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """
         Hash password using bcrypt.
-        
+
+        bcrypt takes ~100ms+ at the configured cost, so the work runs in a
+        bounded thread pool instead of blocking the event loop.
+
         Args:
             password: Plain text password
-            
+
         Returns:
             str: Hashed password
         """
-        # Generate salt and hash password
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
-    
-    def verify_password(self, password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor, self._hash_password_sync, password
+        )
+
+    def _hash_password_sync(self, password: str) -> str:
+        """Hash password using bcrypt (blocking)"""
+        return self._pwd_ctx.hash(password)
+
+    async def verify_password(self, password: str, hashed_password) -> bool:
         """
         Verify password against hash.
-        
+
+        Runs in the bcrypt thread pool so other requests keep progressing
+        while the comparison grinds.
+
         Args:
             password: Plain text password
-            hashed_password: Stored hash
-            
+            hashed_password: Stored hash (str or bytes)
+
         Returns:
             bool: True if password matches
         """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor, self._verify_password_sync, password, hashed_password
+        )
+
+    def _verify_password_sync(self, password: str, hashed_password) -> bool:
+        """Verify password against hash (blocking)"""
         try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                hashed_password.encode('utf-8')
-            )
+            # Stored hashes may come back from the DB as bytes; passlib
+            # expects text.
+            if isinstance(hashed_password, bytes):
+                hashed_password = hashed_password.decode('utf-8')
+            return self._pwd_ctx.verify(password, hashed_password)
         except Exception as e:
             logger.error(f"Password verification error: {e}")
             return False
@@ -98,29 +386,36 @@ class AuthService:
             Tuple[bool, list]: (is_valid, list_of_requirements)
         """
         requirements = []
-        is_valid = True
-        
+
         if len(password) < 8:
             requirements.append("Password must be at least 8 characters long")
-            is_valid = False
-        
-        if not any(c.isupper() for c in password):
+
+        # One pass over the password collecting every character class,
+        # instead of a separate any(...) scan per rule.
+        flags = 0
+        for c in password:
+            if c.isupper():
+                flags |= _HAS_UPPER
+            elif c.islower():
+                flags |= _HAS_LOWER
+            elif c.isdigit():
+                flags |= _HAS_DIGIT
+            if c in _SPECIAL_CHARS:
+                flags |= _HAS_SPECIAL
+
+        if not flags & _HAS_UPPER:
             requirements.append("Password must contain at least one uppercase letter")
-            is_valid = False
-        
-        if not any(c.islower() for c in password):
+
+        if not flags & _HAS_LOWER:
             requirements.append("Password must contain at least one lowercase letter")
-            is_valid = False
-        
-        if not any(c.isdigit() for c in password):
+
+        if not flags & _HAS_DIGIT:
             requirements.append("Password must contain at least one number")
-            is_valid = False
-        
-        if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+
+        if not flags & _HAS_SPECIAL:
             requirements.append("Password must contain at least one special character")
-            is_valid = False
-        
-        return is_valid, requirements
+
+        return not requirements, requirements
     
     # JWT Token Management
     
@@ -141,14 +436,15 @@ class AuthService:
         Returns:
             str: JWT access token
         """
-        now = datetime.now(timezone.utc)
-        expire = now + timedelta(minutes=self.access_token_expire_minutes)
-        
+        # Integer epoch is the RFC 7519 NumericDate form; using it directly
+        # skips datetime construction and PyJWT's datetime->int conversion.
+        now = int(time.time())
+
         payload = {
             "sub": user_id,  # Subject (user ID)
             "email": email,
             "iat": now,  # Issued at
-            "exp": expire,  # Expiration
+            "exp": now + self._access_ttl,  # Expiration
             "type": "access",
             "jti": self._generate_jti()  # JWT ID for blacklisting
         }
@@ -158,8 +454,11 @@ class AuthService:
             payload.update(additional_claims)
         
         try:
-            token = jwt.encode(payload, self.jwt_secret, algorithm=self.jwt_algorithm)
-            
+            if self.jwt_algorithm == "HS256":
+                token = _encode_hs256(payload, self._jwt_secret_bytes)
+            else:
+                token = jwt.encode(payload, self._signing_key, algorithm=self.jwt_algorithm)
+
             logger.info(f"Access token created for user {user_id}")
             return token
             
@@ -178,25 +477,27 @@ class AuthService:
         Returns:
             str: JWT refresh token
         """
-        now = datetime.now(timezone.utc)
-        expire = now + timedelta(days=self.refresh_token_expire_days)
-        
+        now = int(time.time())
+
         payload = {
             "sub": user_id,
             "email": email,
             "iat": now,
-            "exp": expire,
+            "exp": now + self._refresh_ttl,
             "type": "refresh",
             "jti": self._generate_jti()
         }
         
         try:
-            token = jwt.encode(
-                payload, 
-                self.jwt_refresh_secret, 
-                algorithm=self.jwt_algorithm
-            )
-            
+            if self.jwt_algorithm == "HS256":
+                token = _encode_hs256(payload, self._jwt_refresh_secret_bytes)
+            else:
+                token = jwt.encode(
+                    payload,
+                    self._refresh_signing_key,
+                    algorithm=self.jwt_algorithm
+                )
+
             logger.info(f"Refresh token created for user {user_id}")
             return token
             
@@ -204,50 +505,66 @@ class AuthService:
             logger.error(f"Refresh token creation failed: {e}")
             raise AuthenticationError("Token creation failed")
     
-    async def validate_access_token(self, token: str) -> Dict[str, Any]:
+    async def validate_access_token(self, token: str) -> UserContext:
         """
         Validate JWT access token.
-        
+
         Args:
             token: JWT access token
-            
+
         Returns:
-            Dict[str, Any]: User context from token
-            
+            UserContext: User context from token
+
         Raises:
             TokenExpiredError: If token is expired
             InvalidTokenError: If token is invalid
         """
         try:
-            # Check if token is blacklisted
-            if self._is_token_blacklisted(token):
+            # Cache hit: skip signature verification and payload parsing.
+            # The blacklist can change between requests, so re-check it.
+            cache_key = hashlib.sha256(token.encode('utf-8')).digest()
+            cached_context = self._token_cache_get(cache_key)
+            if cached_context is not None:
+                if await self._is_jti_blacklisted(cached_context.jti):
+                    raise InvalidTokenError("Token has been revoked")
+                return cached_context
+
+            # Decode and validate token; the blacklist check reuses the
+            # verified payload's JTI instead of decoding the token twice.
+            if self.jwt_algorithm == "HS256":
+                payload = _decode_hs256(token, self._jwt_secret_bytes)
+            else:
+                payload = jwt.decode(
+                    token,
+                    self._verify_key,
+                    algorithms=[self.jwt_algorithm]
+                )
+
+            if await self._is_jti_blacklisted(payload.get("jti")):
                 raise InvalidTokenError("Token has been revoked")
-            
-            # Decode and validate token
-            payload = jwt.decode(
-                token,
-                self.jwt_secret,
-                algorithms=[self.jwt_algorithm]
-            )
-            
+
             # Verify token type
             if payload.get("type") != "access":
                 raise InvalidTokenError("Invalid token type")
             
-            # Extract user context
-            user_context = {
-                "user_id": payload["sub"],
-                "email": payload["email"],
-                "jti": payload.get("jti"),
-                "issued_at": payload.get("iat"),
-                "expires_at": payload.get("exp")
+            # Extract user context as one immutable struct; additional
+            # claims land in extra without resizing a per-request dict
+            extra = {
+                key: value for key, value in payload.items()
+                if key not in _STANDARD_CLAIMS
             }
-            
-            # Add any additional claims
-            for key, value in payload.items():
-                if key not in ["sub", "email", "iat", "exp", "type", "jti"]:
-                    user_context[key] = value
-            
+            user_context = UserContext(
+                user_id=payload["sub"],
+                email=payload["email"],
+                jti=payload.get("jti"),
+                issued_at=payload.get("iat"),
+                expires_at=payload.get("exp"),
+                extra=extra or None
+            )
+
+            # Only successfully validated tokens are ever cached
+            self._token_cache_put(cache_key, user_context, user_context.expires_at)
+
             return user_context
             
         except jwt.ExpiredSignatureError:
@@ -271,15 +588,18 @@ class AuthService:
             Dict[str, Any]: User context from token
         """
         try:
-            if self._is_token_blacklisted(token):
+            if self.jwt_algorithm == "HS256":
+                payload = _decode_hs256(token, self._jwt_refresh_secret_bytes)
+            else:
+                payload = jwt.decode(
+                    token,
+                    self._refresh_verify_key,
+                    algorithms=[self.jwt_algorithm]
+                )
+
+            if await self._is_jti_blacklisted(payload.get("jti")):
                 raise InvalidTokenError("Token has been revoked")
-            
-            payload = jwt.decode(
-                token,
-                self.jwt_refresh_secret,
-                algorithms=[self.jwt_algorithm]
-            )
-            
+
             if payload.get("type") != "refresh":
                 raise InvalidTokenError("Invalid token type")
             
@@ -310,7 +630,7 @@ class AuthService:
             user_context = await self.validate_refresh_token(refresh_token)
             
             # Blacklist old refresh token
-            self._blacklist_token(refresh_token)
+            await self._blacklist_token(refresh_token)
             
             # Create new tokens
             new_access_token = self.create_access_token(
@@ -356,33 +676,27 @@ class AuthService:
         """
         async with db_manager.get_session() as session:
             try:
-                # Check if email already exists
-                existing_user = await self._get_user_by_email(session, email)
-                if existing_user:
-                    raise AuthenticationError("Email already registered")
-                
-                # Check if username already exists
-                existing_username = await self._get_user_by_username(session, username)
-                if existing_username:
-                    raise AuthenticationError("Username already taken")
-                
                 # Hash password
-                password_hash = self.hash_password(password)
-                
-                # Create user
+                password_hash = await self.hash_password(password)
+
+                # Create user; the UNIQUE constraints enforce email/username
+                # uniqueness inside the INSERT itself, so no pre-check SELECT
                 user_id = await self._create_user(
                     session, email, username, password_hash, first_name, last_name
                 )
-                
+
+                # Stringify the UUID only at the JWT/response boundary
+                user_id_str = str(user_id)
+
                 # Create tokens
-                access_token = self.create_access_token(user_id, email)
-                refresh_token = self.create_refresh_token(user_id, email)
-                
+                access_token = self.create_access_token(user_id_str, email)
+                refresh_token = self.create_refresh_token(user_id_str, email)
+
                 logger.info(f"User created successfully: {email}")
-                
+
                 # Return user data
                 user_data = {
-                    "user_id": user_id,
+                    "user_id": user_id_str,
                     "email": email,
                     "username": username,
                     "first_name": first_name,
@@ -422,7 +736,7 @@ class AuthService:
                     raise AuthenticationError("Invalid email or password")
                 
                 # Verify password
-                if not self.verify_password(password, user["password_hash"]):
+                if not await self.verify_password(password, user["password_hash"]):
                     logger.warning(f"Failed login attempt for email: {email}")
                     raise AuthenticationError("Invalid email or password")
                 
@@ -430,7 +744,8 @@ class AuthService:
                 if not user.get("is_active", True):
                     raise AuthenticationError("Account is deactivated")
                 
-                # Convert UUID to string for JSON serialization
+                # Stringify only for JWT claims and the JSON response; the
+                # DB path below keeps the native UUID object
                 user_id_str = str(user["userid"])
                 
                 # Create tokens
@@ -444,9 +759,12 @@ class AuthService:
                     user["email"]
                 )
                 
-                # Update last login
-                await self._update_last_login(session, user_id_str)
-                
+                # Update last login in the background: the timestamp is
+                # non-critical, so the login response doesn't wait for it
+                task = asyncio.create_task(self._update_last_login(user["userid"]))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+
                 logger.info(f"User authenticated successfully: {email}")
                 
                 # Return user data (excluding sensitive info)
@@ -477,8 +795,8 @@ class AuthService:
         """
         try:
             # Blacklist both tokens
-            self._blacklist_token(access_token)
-            self._blacklist_token(refresh_token)
+            await self._blacklist_token(access_token)
+            await self._blacklist_token(refresh_token)
             
             logger.info("User logged out successfully")
             
@@ -486,32 +804,105 @@ class AuthService:
             logger.error(f"Logout failed: {e}")
             raise AuthenticationError("Logout failed")
     
+    # Access-Token Validation Cache
+
+    def _token_cache_get(self, key: bytes) -> Optional[UserContext]:
+        """Get cached user context for a validated token, if still fresh"""
+        entry = self._token_cache.get(key)
+        if entry is None:
+            return None
+
+        user_context, cache_expires_at = entry
+        if time.time() >= cache_expires_at:
+            self._token_cache.pop(key, None)
+            return None
+
+        # Refresh recency so popitem(last=False) evicts least-recently
+        # used entries rather than oldest-inserted
+        self._token_cache.move_to_end(key)
+        return user_context
+
+    def _token_cache_put(
+        self,
+        key: bytes,
+        user_context: UserContext,
+        token_exp: Optional[int]
+    ) -> None:
+        """Cache a validated token; entries never outlive the token itself"""
+        if self._token_cache_ttl <= 0:
+            return
+
+        cache_expires_at = time.time() + self._token_cache_ttl
+        if token_exp:
+            cache_expires_at = min(cache_expires_at, float(token_exp))
+
+        while len(self._token_cache) >= self._token_cache_max_size:
+            self._token_cache.popitem(last=False)
+
+        self._token_cache[key] = (user_context, cache_expires_at)
+
     # Token Blacklisting
-    
-    def _blacklist_token(self, token: str) -> None:
-        """Add token to blacklist"""
-        # In production, store in Redis with expiration
-        jti = self._extract_jti_from_token(token)
-        if jti:
-            self._blacklisted_tokens.add(jti)
-    
-    def _is_token_blacklisted(self, token: str) -> bool:
-        """Check if token is blacklisted"""
-        jti = self._extract_jti_from_token(token)
-        return jti in self._blacklisted_tokens if jti else False
-    
-    def _extract_jti_from_token(self, token: str) -> Optional[str]:
-        """Extract JTI from token without validation"""
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Get (lazily created) Redis client for the token blacklist"""
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True
+            )
+        return self._redis
+
+    async def _blacklist_token(self, token: str) -> None:
+        """Blacklist a token until the moment it would have expired anyway.
+
+        The token is decoded without verification because the signature may
+        legitimately already be expired at logout time.
+        """
         try:
-            # Decode without verification to get JTI
             payload = jwt.decode(token, options={"verify_signature": False})
-            return payload.get("jti")
-        except:
-            return None
+        except Exception:
+            return
+
+        jti = payload.get("jti")
+        if not jti:
+            return
+
+        ttl = int(payload.get("exp", 0) - time.time())
+        if ttl <= 0:
+            # Already expired; nothing left to revoke
+            return
+
+        try:
+            await self._get_redis().set(f"blacklist:{jti}", "1", ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis blacklist write failed, using in-memory fallback: {e}")
+            self._blacklist_bloom.add(jti)
+            self._blacklist_lru[jti] = None
+            self._blacklist_lru.move_to_end(jti)
+            while len(self._blacklist_lru) > _BLACKLIST_LRU_MAX:
+                self._blacklist_lru.popitem(last=False)
+
+    async def _is_jti_blacklisted(self, jti: Optional[str]) -> bool:
+        """Check whether a (verified) JTI has been revoked"""
+        if not jti:
+            return False
+
+        try:
+            if await self._get_redis().exists(f"blacklist:{jti}"):
+                return True
+        except Exception as e:
+            logger.warning(f"Redis blacklist check failed, using in-memory fallback: {e}")
+
+        # A Bloom miss means definitely not revoked locally; a hit may be a
+        # false positive and still needs the exact LRU check.
+        if jti not in self._blacklist_bloom:
+            return False
+        return jti in self._blacklist_lru
     
     def _generate_jti(self) -> str:
-        """Generate unique JWT ID"""
-        return secrets.token_urlsafe(32)
+        """Generate unique JWT ID (128 bits of CSPRNG entropy)"""
+        return secrets.token_urlsafe(16)
     
     # Database Operations
     
@@ -522,15 +913,7 @@ class AuthService:
     ) -> Optional[Dict[str, Any]]:
         """Get user by email from database"""
         try:
-            query = text("""
-                SELECT 
-                    userid, email, username, first_name, last_name,
-                    password_hash, is_active, last_login, created_at
-                FROM users 
-                WHERE email = :email
-            """)
-            
-            result = await session.execute(query, {"email": email})
+            result = await session.execute(_USER_BY_EMAIL_QUERY, {"email": email})
             row = result.fetchone()
             
             if not row:
@@ -542,32 +925,35 @@ class AuthService:
             logger.error(f"Database error fetching user by email: {e}")
             raise AuthenticationError("Database error during authentication")
     
-    async def _get_user_by_username(
-        self, 
-        session: AsyncSession, 
+    async def _check_identity_conflict(
+        self,
+        session: AsyncSession,
+        email: str,
         username: str
-    ) -> Optional[Dict[str, Any]]:
-        """Get user by username from database"""
+    ) -> Optional[str]:
+        """Check email and username uniqueness in a single query.
+
+        Returns the conflict message to raise, or None when both are free.
+        """
         try:
-            query = text("""
-                SELECT 
-                    userid, email, username, first_name, last_name,
-                    password_hash, is_active, last_login, created_at
-                FROM users 
-                WHERE username = :username
-            """)
-            
-            result = await session.execute(query, {"username": username})
-            row = result.fetchone()
-            
-            if not row:
-                return None
-            
-            return dict(row._mapping)
-            
+            result = await session.execute(
+                _IDENTITY_CONFLICT_QUERY, {"email": email, "username": username}
+            )
+            rows = result.fetchall()
+
         except Exception as e:
-            logger.error(f"Database error fetching user by username: {e}")
+            logger.error(f"Database error checking identity conflicts: {e}")
             raise AuthenticationError("Database error during registration")
+
+        for row in rows:
+            if row.email == email:
+                return "Email already registered"
+
+        for row in rows:
+            if row.username == username:
+                return "Username already taken"
+
+        return None
     
     async def _create_user(
         self,
@@ -577,26 +963,20 @@ class AuthService:
         password_hash: str,
         first_name: str,
         last_name: str
-    ) -> str:
-        """Create new user in database"""
+    ) -> uuid.UUID:
+        """Create new user in database.
+
+        The UNIQUE constraints on email and username double as the existence
+        check: ON CONFLICT DO NOTHING makes a duplicate insert return no row
+        instead of erroring, collapsing check + insert into one statement.
+        """
         try:
-            import uuid
-            from datetime import datetime, timezone
-            
-            user_id = str(uuid.uuid4())
+            # asyncpg binds UUID objects to uuid columns directly, so the
+            # id stays a UUID end to end; callers stringify only for JWTs
+            user_id = uuid.uuid4()
             now = datetime.now(timezone.utc)
-            
-            query = text("""
-                INSERT INTO users (
-                    userid, email, username, first_name, last_name,
-                    password_hash, is_active, created_at, last_login
-                ) VALUES (
-                    :userid, :email, :username, :first_name, :last_name,
-                    :password_hash, :is_active, :created_at, :last_login
-                )
-            """)
-            
-            await session.execute(query, {
+
+            result = await session.execute(_CREATE_USER_QUERY, {
                 "userid": user_id,
                 "email": email,
                 "username": username,
@@ -607,34 +987,37 @@ class AuthService:
                 "created_at": now,
                 "last_login": None
             })
-            
-            await session.commit()
-            return user_id
-            
+            row = result.fetchone()
+
         except Exception as e:
             logger.error(f"Database error creating user: {e}")
             raise AuthenticationError("Database error during registration")
+
+        if row is None:
+            # Nothing inserted: a unique constraint fired. One diagnostic
+            # SELECT attributes the conflict for the error message.
+            conflict = await self._check_identity_conflict(session, email, username)
+            raise AuthenticationError(conflict or "Registration failed")
+
+        await session.commit()
+        return row.userid
     
-    async def _update_last_login(
-        self, 
-        session: AsyncSession, 
-        user_id: str
-    ) -> None:
-        """Update user's last login timestamp"""
+    async def _update_last_login(self, user_id: uuid.UUID) -> None:
+        """Update user's last login timestamp.
+
+        Runs as a fire-and-forget task on its own session so login
+        responses never wait on this UPDATE.
+        """
         try:
             now = datetime.now(timezone.utc)
-            
-            query = text("""
-                UPDATE users 
-                SET last_login = :last_login
-                WHERE userid = :user_id
-            """)
-            
-            await session.execute(query, {
-                "last_login": now,
-                "user_id": user_id
-            })
-            
+
+            async with db_manager.get_session() as session:
+                await session.execute(_UPDATE_LAST_LOGIN_QUERY, {
+                    "last_login": now,
+                    "user_id": user_id
+                })
+                await session.commit()
+
         except Exception as e:
             logger.error(f"Database error updating last login: {e}")
             # Don't raise exception here as it's not critical for auth
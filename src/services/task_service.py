@@ -11,15 +11,18 @@ This service provides:
 """
 
 import logging
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any, Tuple
-from uuid import uuid4
-
+from functools import lru_cache
+from typing import AsyncIterator, Final, List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.task import (
     Task, TaskCreateRequest, TaskUpdateRequest, TaskQueryParams,
-    TaskResponse, TaskListResponse, TaskStatus, TaskPriority, TaskCategory
+    TaskResponse, TaskListResponse, TaskStatus, TaskPriority, TaskCategory,
+    uuid7
 )
 from domain.repositories.task_repository import ITaskRepository, SQLAlchemyTaskRepository
 from infrastructure.database.connection import get_db_session
@@ -32,6 +35,114 @@ from core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Allowed status transitions, built once. frozenset membership keeps the
+# per-task check in bulk updates to two dict/set lookups with no allocations.
+_ALLOWED_TRANSITIONS: Final[Dict[TaskStatus, frozenset]] = {
+    TaskStatus.PENDING: frozenset({TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED}),
+    TaskStatus.IN_PROGRESS: frozenset({
+        TaskStatus.COMPLETED, TaskStatus.BLOCKED, TaskStatus.CANCELLED
+    }),
+    TaskStatus.BLOCKED: frozenset({TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED}),
+    TaskStatus.COMPLETED: frozenset(),  # Final state
+    TaskStatus.CANCELLED: frozenset()   # Final state
+}
+
+_NO_TRANSITIONS: Final[frozenset] = frozenset()
+
+
+@lru_cache(maxsize=len(TaskStatus) ** 2)
+def _is_transition_allowed(current_status: TaskStatus, new_status: TaskStatus) -> bool:
+    """Pure transition check, memoized over the 25 possible status pairs.
+
+    Returns a bool instead of raising so the cache stays side-effect
+    free; callers raise ValidationError on False. After warmup every
+    check is a C-level cache hit.
+    """
+    return (new_status == current_status
+            or new_status in _ALLOWED_TRANSITIONS.get(current_status, _NO_TRANSITIONS))
+
+# Fields a TaskUpdateRequest may change, intersected against the dumped
+# payload so unknown keys never reach the repository
+_TASK_UPDATE_FIELDS: Final[frozenset] = frozenset({
+    'name', 'description', 'start_time', 'end_time',
+    'color', 'status', 'priority', 'category'
+})
+
+# Statistics cache: keyed by (user_id, latest updated_at), so any task
+# write naturally invalidates the entry by changing the key. The TTL
+# bounds staleness from writes that don't touch updated_at (deletes);
+# the size cap bounds memory. OrderedDict gives LRU via move_to_end,
+# matching the token cache in the auth service.
+_STATS_CACHE_TTL_SECONDS: Final = 30.0
+_STATS_CACHE_MAX_SIZE: Final = 10_000
+_stats_cache: "OrderedDict[Tuple[str, Optional[datetime]], Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+
+class UserScheduleCache:
+    """
+    In-memory view of a user's active schedule for repeated conflict probes.
+
+    One SELECT loads the user's active (task_id, start_time, end_time)
+    triples; every subsequent probe is answered from sorted arrays instead
+    of another round-trip and index scan. Intervals are kept sorted by
+    start time alongside a running maximum of end times, so the no-conflict
+    case is a pair of binary searches. Probes use the same half-open
+    ``[start, end)`` overlap rule as the SQL range queries.
+
+    The cache is request-scoped by construction: build it, probe it,
+    record local writes with add(), and throw it away with the request.
+    """
+
+    __slots__ = ("_intervals", "_starts", "_max_end_prefix")
+
+    def __init__(self, intervals: List[Tuple[str, datetime, datetime]]):
+        # Stored as (start_time, end_time, task_id) so sorting and
+        # bisecting key on start time without a key function
+        self._intervals = sorted(
+            (start, end, task_id) for task_id, start, end in intervals
+        )
+        self._rebuild_index()
+
+    @classmethod
+    async def load(cls, repository: ITaskRepository, user_id: str) -> 'UserScheduleCache':
+        """Build the cache from the user's active tasks in one query."""
+        return cls(await repository.get_active_schedule(user_id))
+
+    def _rebuild_index(self) -> None:
+        self._starts = [start for start, _, _ in self._intervals]
+        self._max_end_prefix = []
+        latest: Optional[datetime] = None
+        for _, end, _ in self._intervals:
+            if latest is None or end > latest:
+                latest = end
+            self._max_end_prefix.append(latest)
+
+    def first_conflict(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_task_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the ID of one conflicting task, or None if the slot is free."""
+        # Overlap needs start < end_time; everything at or past end_time
+        # can be discarded with one bisect
+        hi = bisect_left(self._starts, end_time)
+
+        # If no candidate's end reaches past start_time, the prefix max
+        # settles it without touching individual intervals
+        if hi == 0 or self._max_end_prefix[hi - 1] <= start_time:
+            return None
+
+        for start, end, task_id in self._intervals[:hi]:
+            if end > start_time and task_id != exclude_task_id:
+                return task_id
+        return None
+
+    def add(self, task_id: str, start_time: datetime, end_time: datetime) -> None:
+        """Record a locally created task so later probes see it."""
+        insort(self._intervals, (start_time, end_time, task_id))
+        self._rebuild_index()
+
 
 class TaskService:
     """
@@ -40,12 +151,23 @@ class TaskService:
     
     def __init__(self, task_repository: Optional[ITaskRepository] = None):
         self._task_repository = task_repository
-    
+        self._cached_session: Optional[AsyncSession] = None
+        self._cached_repository: Optional[ITaskRepository] = None
+
     async def _get_repository(self, session: AsyncSession) -> ITaskRepository:
-        """Get task repository instance"""
+        """Get task repository instance.
+
+        The service lives for one request and the session is request-
+        scoped, so the repository wrapper is constructed once and reused
+        for every call on the same session instead of being reallocated
+        per method.
+        """
         if self._task_repository:
             return self._task_repository
-        return SQLAlchemyTaskRepository(session)
+        if self._cached_session is not session:
+            self._cached_repository = SQLAlchemyTaskRepository(session)
+            self._cached_session = session
+        return self._cached_repository
     
     # Core CRUD Operations
     
@@ -77,7 +199,7 @@ class TaskService:
                 
                 # Create domain entity
                 task = Task(
-                    id=str(uuid4()),
+                    id=str(uuid7()),
                     user_id=user_id,
                     name=task_request.name,
                     description=task_request.description,
@@ -92,15 +214,15 @@ class TaskService:
                 # Save to repository
                 created_task = await repository.create(task)
                 
-                logger.info(f"Task created successfully: {created_task.id} for user {user_id}")
-                
+                logger.info("Task created successfully: %s for user %s", created_task.id, user_id)
+
                 # Convert to response
-                return TaskResponse.from_db_model(created_task.to_dict())
+                return TaskResponse.from_task(created_task)
                 
             except (ValidationError, ScheduleConflictError):
                 raise
             except Exception as e:
-                logger.error(f"Task creation failed: {e}")
+                logger.error("Task creation failed: %s", e)
                 raise DatabaseError(f"Failed to create task: {e}")
     
     async def get_task(self, user_id: str, task_id: str) -> TaskResponse:
@@ -121,17 +243,17 @@ class TaskService:
             try:
                 repository = await self._get_repository(session)
                 
-                task = await repository.get_by_id(task_id, user_id)
+                task = await repository.get_by_id(user_id, task_id)
                 
                 if not task:
                     raise TaskNotFoundError(task_id)
                 
-                return TaskResponse.from_db_model(task.to_dict())
-                
+                return TaskResponse.from_task(task)
+
             except TaskNotFoundError:
                 raise
             except Exception as e:
-                logger.error(f"Failed to get task {task_id}: {e}")
+                logger.error("Failed to get task %s: %s", task_id, e)
                 raise DatabaseError(f"Failed to retrieve task: {e}")
     
     async def get_tasks(
@@ -154,12 +276,13 @@ class TaskService:
                 repository = await self._get_repository(session)
                 
                 # Get tasks and total count
-                tasks, total_count = await repository.get_all(user_id, params)
+                tasks, total_count = await repository.get_by_user(user_id, params)
                 
-                # Convert to response models
+                # Convert to response models (one clock read for the batch)
+                now = datetime.now(timezone.utc)
                 task_responses = []
                 for task in tasks:
-                    task_response = TaskResponse.from_db_model(task.to_dict())
+                    task_response = TaskResponse.from_task(task, now=now)
                     task_responses.append(task_response)
                 
                 # Create list response
@@ -171,9 +294,39 @@ class TaskService:
                 )
                 
             except Exception as e:
-                logger.error(f"Failed to get tasks for user {user_id}: {e}")
+                logger.error("Failed to get tasks for user %s: %s", user_id, e)
                 raise DatabaseError(f"Failed to retrieve tasks: {e}")
-    
+
+    async def stream_tasks(
+        self,
+        user_id: str,
+        params: TaskQueryParams
+    ) -> AsyncIterator[TaskResponse]:
+        """
+        Stream tasks for user without buffering the full result set.
+
+        Backed by a server-side cursor, so memory stays flat for
+        arbitrarily large exports. Pagination params are ignored.
+
+        Args:
+            user_id: User requesting tasks
+            params: Query parameters (filters and sorting)
+
+        Yields:
+            TaskResponse: Matching tasks, one at a time
+        """
+        async with get_db_session() as session:
+            try:
+                repository = await self._get_repository(session)
+
+                now = datetime.now(timezone.utc)
+                async for task in repository.iter_all(user_id, params):
+                    yield TaskResponse.from_task(task, now=now)
+
+            except Exception as e:
+                logger.error("Failed to stream tasks for user %s: %s", user_id, e)
+                raise DatabaseError(f"Failed to stream tasks: {e}")
+
     async def update_task(
         self, 
         user_id: str, 
@@ -199,31 +352,44 @@ class TaskService:
         async with get_db_session() as session:
             try:
                 repository = await self._get_repository(session)
-                
-                # Get existing task
-                existing_task = await repository.get_by_id(task_id, user_id)
-                if not existing_task:
-                    raise TaskNotFoundError(task_id)
-                
-                # Apply updates
-                await self._apply_task_updates(existing_task, task_request)
-                
-                # Business validation
-                await self._validate_task_update(
-                    repository, user_id, existing_task, task_request
+
+                # model_dump is the C-accelerated pydantic v2 path;
+                # exclude_none keeps explicit nulls from overwriting columns
+                update_data = task_request.model_dump(
+                    exclude_unset=True, exclude_none=True
                 )
-                
-                # Save updates
-                updated_task = await repository.update(existing_task)
-                
-                logger.info(f"Task updated successfully: {task_id}")
-                
-                return TaskResponse.from_db_model(updated_task.to_dict())
-                
+                update_data = {
+                    field: update_data[field]
+                    for field in _TASK_UPDATE_FIELDS & update_data.keys()
+                }
+
+                # Only time changes need the existing row (to merge the
+                # unchanged bound of the range) and a conflict check
+                if ('start_time' in update_data or 'end_time' in update_data):
+                    existing_task = await repository.get_by_id(user_id, task_id)
+                    if not existing_task:
+                        raise TaskNotFoundError(task_id)
+
+                    await self._validate_task_update(
+                        repository, user_id, existing_task, task_request
+                    )
+
+                # One UPDATE ... RETURNING folds the existence check into
+                # the write; no returned row means the task doesn't exist
+                updated_task = await repository.update_fields(
+                    user_id, task_id, update_data
+                )
+                if updated_task is None:
+                    raise TaskNotFoundError(task_id)
+
+                logger.info("Task updated successfully: %s", task_id)
+
+                return TaskResponse.from_task(updated_task)
+
             except (TaskNotFoundError, ValidationError, ScheduleConflictError):
                 raise
             except Exception as e:
-                logger.error(f"Task update failed: {e}")
+                logger.error("Task update failed: %s", e)
                 raise DatabaseError(f"Failed to update task: {e}")
     
     async def delete_task(self, user_id: str, task_id: str) -> bool:
@@ -243,24 +409,20 @@ class TaskService:
         async with get_db_session() as session:
             try:
                 repository = await self._get_repository(session)
-                
-                # Check if task exists
-                existing_task = await repository.get_by_id(task_id, user_id)
-                if not existing_task:
+
+                # The DELETE's rowcount doubles as the existence check, so
+                # there is no SELECT round-trip first
+                deleted = await repository.delete(user_id, task_id)
+                if not deleted:
                     raise TaskNotFoundError(task_id)
-                
-                # Delete task
-                deleted = await repository.delete(task_id, user_id)
-                
-                if deleted:
-                    logger.info(f"Task deleted successfully: {task_id}")
-                
-                return deleted
-                
+
+                logger.info("Task deleted successfully: %s", task_id)
+                return True
+
             except TaskNotFoundError:
                 raise
             except Exception as e:
-                logger.error(f"Task deletion failed: {e}")
+                logger.error("Task deletion failed: %s", e)
                 raise DatabaseError(f"Failed to delete task: {e}")
     
     # Advanced Operations
@@ -289,14 +451,15 @@ class TaskService:
                 tasks = await repository.get_tasks_in_date_range(
                     user_id, start_date, end_date
                 )
-                
+
+                now = datetime.now(timezone.utc)
                 return [
-                    TaskResponse.from_db_model(task.to_dict()) 
+                    TaskResponse.from_task(task, now=now)
                     for task in tasks
                 ]
                 
             except Exception as e:
-                logger.error(f"Failed to get tasks in date range: {e}")
+                logger.error("Failed to get tasks in date range: %s", e)
                 raise DatabaseError(f"Failed to retrieve tasks in date range: {e}")
     
     async def get_overdue_tasks(self, user_id: str) -> List[TaskResponse]:
@@ -314,14 +477,15 @@ class TaskService:
                 repository = await self._get_repository(session)
                 
                 tasks = await repository.get_overdue_tasks(user_id)
-                
+
+                now = datetime.now(timezone.utc)
                 return [
-                    TaskResponse.from_db_model(task.to_dict()) 
+                    TaskResponse.from_task(task, now=now)
                     for task in tasks
                 ]
                 
             except Exception as e:
-                logger.error(f"Failed to get overdue tasks: {e}")
+                logger.error("Failed to get overdue tasks: %s", e)
                 raise DatabaseError(f"Failed to retrieve overdue tasks: {e}")
     
     async def update_task_status(
@@ -346,7 +510,7 @@ class TaskService:
                 repository = await self._get_repository(session)
                 
                 # Get existing task
-                task = await repository.get_by_id(task_id, user_id)
+                task = await repository.get_by_id(user_id, task_id)
                 if not task:
                     raise TaskNotFoundError(task_id)
                 
@@ -363,14 +527,14 @@ class TaskService:
                 # Save changes
                 updated_task = await repository.update(task)
                 
-                logger.info(f"Task status updated: {task_id} -> {new_status.value}")
-                
-                return TaskResponse.from_db_model(updated_task.to_dict())
+                logger.info("Task status updated: %s -> %s", task_id, new_status.value)
+
+                return TaskResponse.from_task(updated_task)
                 
             except (TaskNotFoundError, ValidationError):
                 raise
             except Exception as e:
-                logger.error(f"Status update failed: {e}")
+                logger.error("Status update failed: %s", e)
                 raise DatabaseError(f"Failed to update task status: {e}")
     
     async def check_schedule_conflicts(
@@ -396,17 +560,20 @@ class TaskService:
             try:
                 repository = await self._get_repository(session)
                 
-                conflicts = await repository.check_schedule_conflict(
+                # The public endpoint returns every conflicting task, so
+                # this keeps the full fetch rather than the LIMIT 1 probe
+                conflicts = await repository.get_conflicting_tasks(
                     user_id, start_time, end_time, exclude_task_id
                 )
-                
+
+                now = datetime.now(timezone.utc)
                 return [
-                    TaskResponse.from_db_model(task.to_dict()) 
+                    TaskResponse.from_task(task, now=now)
                     for task in conflicts
                 ]
                 
             except Exception as e:
-                logger.error(f"Conflict check failed: {e}")
+                logger.error("Conflict check failed: %s", e)
                 raise DatabaseError(f"Failed to check schedule conflicts: {e}")
     
     async def get_task_statistics(self, user_id: str) -> Dict[str, Any]:
@@ -422,34 +589,123 @@ class TaskService:
         async with get_db_session() as session:
             try:
                 repository = await self._get_repository(session)
-                
-                stats = await repository.get_task_statistics(user_id)
-                
-                # Add additional calculated metrics
-                today = datetime.now(timezone.utc).date()
-                week_start = today - timedelta(days=today.weekday())
-                week_end = week_start + timedelta(days=6)
-                
-                # Get tasks for this week
-                week_tasks = await repository.get_tasks_in_date_range(
-                    user_id,
-                    datetime.combine(week_start, datetime.min.time()).replace(tzinfo=timezone.utc),
-                    datetime.combine(week_end, datetime.max.time()).replace(tzinfo=timezone.utc)
+
+                # Cheap change marker first: MAX(updated_at) is an index
+                # probe, and a matching cache key means the aggregates
+                # can't have changed (modulo deletes, bounded by the TTL)
+                latest_update = await repository.get_latest_task_update(user_id)
+                cache_key = (user_id, latest_update)
+
+                cached = _stats_cache.get(cache_key)
+                if cached is not None:
+                    stats, cached_at = cached
+                    if time.monotonic() - cached_at < _STATS_CACHE_TTL_SECONDS:
+                        _stats_cache.move_to_end(cache_key)
+                        return stats
+                    del _stats_cache[cache_key]
+
+                # Week bounds by plain timedelta arithmetic: midnight on
+                # Monday through the last microsecond of Sunday, without
+                # the date/combine/replace allocation chain
+                today = datetime.now(timezone.utc)
+                week_start = (
+                    today.replace(hour=0, minute=0, second=0, microsecond=0)
+                    - timedelta(days=today.weekday())
                 )
-                
-                stats['this_week_tasks'] = len(week_tasks)
-                stats['this_week_completed'] = len([
-                    t for t in week_tasks if t.status == TaskStatus.COMPLETED
-                ])
-                
+                week_end = week_start + timedelta(days=7, microseconds=-1)
+
+                # One query with conditional aggregates covers the overall
+                # counters and the this-week counts; no rows are hydrated
+                stats = await repository.get_task_statistics_with_week(
+                    user_id, week_start, week_end
+                )
+
+                _stats_cache[cache_key] = (stats, time.monotonic())
+                while len(_stats_cache) > _STATS_CACHE_MAX_SIZE:
+                    _stats_cache.popitem(last=False)
+
                 return stats
-                
+
             except Exception as e:
-                logger.error(f"Failed to get task statistics: {e}")
+                logger.error("Failed to get task statistics: %s", e)
                 raise DatabaseError(f"Failed to retrieve task statistics: {e}")
     
     # Bulk Operations
-    
+
+    async def bulk_create_tasks(
+        self,
+        user_id: str,
+        task_requests: List[TaskCreateRequest]
+    ) -> List[TaskResponse]:
+        """
+        Create multiple tasks in a single statement.
+
+        Args:
+            user_id: User creating the tasks
+            task_requests: Task creation requests
+
+        Returns:
+            List[TaskResponse]: Created tasks, in request order
+
+        Raises:
+            ScheduleConflictError: If any request conflicts with an
+                existing task or another request in the batch
+        """
+        async with get_db_session() as session:
+            try:
+                if not task_requests:
+                    return []
+
+                repository = await self._get_repository(session)
+
+                # One SELECT loads the user's active schedule; each
+                # request is then probed in memory, and accepted ranges
+                # are fed back so intra-batch conflicts are caught too
+                schedule = await UserScheduleCache.load(repository, user_id)
+
+                tasks = []
+                for task_request in task_requests:
+                    conflicting_id = schedule.first_conflict(
+                        task_request.start_time, task_request.end_time
+                    )
+                    if conflicting_id is not None:
+                        raise ScheduleConflictError(conflicting_id)
+
+                    task = Task(
+                        id=str(uuid7()),
+                        user_id=user_id,
+                        name=task_request.name,
+                        description=task_request.description,
+                        start_time=task_request.start_time,
+                        end_time=task_request.end_time,
+                        color=task_request.color,
+                        status=task_request.status,
+                        priority=task_request.priority,
+                        category=task_request.category
+                    )
+                    schedule.add(task.id, task.start_time, task.end_time)
+                    tasks.append(task)
+
+                # One multi-row INSERT instead of a statement per task
+                created_tasks = await repository.bulk_create(tasks)
+
+                logger.info(
+                    "Bulk created %d tasks for user %s",
+                    len(created_tasks), user_id
+                )
+
+                now = datetime.now(timezone.utc)
+                return [
+                    TaskResponse.from_task(task, now=now)
+                    for task in created_tasks
+                ]
+
+            except (ValidationError, ScheduleConflictError):
+                raise
+            except Exception as e:
+                logger.error("Bulk task creation failed: %s", e)
+                raise DatabaseError(f"Failed to bulk create tasks: {e}")
+
     async def bulk_update_status(
         self, 
         user_id: str, 
@@ -467,17 +723,51 @@ class TaskService:
         Returns:
             List[TaskResponse]: Updated tasks
         """
-        updated_tasks = []
-        
-        for task_id in task_ids:
+        async with get_db_session() as session:
             try:
-                updated_task = await self.update_task_status(user_id, task_id, new_status)
-                updated_tasks.append(updated_task)
+                repository = await self._get_repository(session)
+
+                # One SELECT fetches every current status, so transition
+                # validation happens in Python without per-task queries
+                current_statuses = await repository.get_task_statuses(user_id, task_ids)
+
+                valid_ids = []
+                for task_id in task_ids:
+                    current_status = current_statuses.get(task_id)
+                    if current_status is None:
+                        logger.warning("Failed to update task %s: task not found", task_id)
+                        continue
+
+                    try:
+                        self._validate_status_transition(current_status, new_status)
+                    except ValidationError as e:
+                        logger.warning("Failed to update task %s: %s", task_id, e)
+                        continue
+
+                    valid_ids.append(task_id)
+
+                if not valid_ids:
+                    return []
+
+                # Single UPDATE ... RETURNING covers all remaining tasks
+                updated_tasks = await repository.bulk_update_status(
+                    user_id, valid_ids, new_status
+                )
+
+                logger.info(
+                    "Bulk status update: %d/%d tasks -> %s",
+                    len(updated_tasks), len(task_ids), new_status.value
+                )
+
+                now = datetime.now(timezone.utc)
+                return [
+                    TaskResponse.from_task(task, now=now)
+                    for task in updated_tasks
+                ]
+
             except Exception as e:
-                logger.warning(f"Failed to update task {task_id}: {e}")
-                # Continue with other tasks
-        
-        return updated_tasks
+                logger.error("Bulk status update failed: %s", e)
+                raise DatabaseError(f"Failed to bulk update task status: {e}")
     
     async def bulk_delete_tasks(
         self, 
@@ -494,17 +784,21 @@ class TaskService:
         Returns:
             Dict[str, bool]: Map of task_id -> deletion_success
         """
-        results = {}
-        
-        for task_id in task_ids:
+        async with get_db_session() as session:
             try:
-                deleted = await self.delete_task(user_id, task_id)
-                results[task_id] = deleted
+                repository = await self._get_repository(session)
+
+                # One DELETE ... RETURNING instead of a query per task
+                results = await repository.bulk_delete(user_id, task_ids)
+
+                deleted_count = sum(1 for deleted in results.values() if deleted)
+                logger.info("Bulk delete: %d/%d tasks removed", deleted_count, len(task_ids))
+
+                return results
+
             except Exception as e:
-                logger.warning(f"Failed to delete task {task_id}: {e}")
-                results[task_id] = False
-        
-        return results
+                logger.error("Bulk delete failed: %s", e)
+                raise DatabaseError(f"Failed to bulk delete tasks: {e}")
     
     # Private Methods - Business Logic
     
@@ -515,16 +809,16 @@ class TaskService:
         task_request: TaskCreateRequest
     ) -> None:
         """Validate task creation business rules"""
-        
-        # Check for schedule conflicts
-        conflicts = await repository.check_schedule_conflict(
+
+        # Validators only need the first conflict, so the single-row
+        # probe avoids hydrating every overlapping task
+        conflicting_id = await repository.check_first_conflict(
             user_id, task_request.start_time, task_request.end_time
         )
-        
-        if conflicts:
-            conflicting_task = conflicts[0]
-            raise ScheduleConflictError(conflicting_task.id)
-        
+
+        if conflicting_id is not None:
+            raise ScheduleConflictError(conflicting_id)
+
         # Additional business validations can be added here
         # e.g., maximum tasks per day, priority constraints, etc.
     
@@ -536,54 +830,38 @@ class TaskService:
         task_request: TaskUpdateRequest
     ) -> None:
         """Validate task update business rules"""
-        
-        # If time is being updated, check for conflicts
-        if (task_request.start_time is not None or 
-            task_request.end_time is not None):
-            
-            start_time = task_request.start_time or existing_task.start_time
-            end_time = task_request.end_time or existing_task.end_time
-            
-            conflicts = await repository.check_schedule_conflict(
-                user_id, start_time, end_time, existing_task.id
-            )
-            
-            if conflicts:
-                conflicting_task = conflicts[0]
-                raise ScheduleConflictError(conflicting_task.id)
-    
-    async def _apply_task_updates(
-        self, 
-        task: Task, 
-        updates: TaskUpdateRequest
-    ) -> None:
-        """Apply updates to task entity"""
-        
-        update_data = updates.dict(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            if hasattr(task, field) and value is not None:
-                setattr(task, field, value)
+
+        # Only time changes can introduce conflicts
+        start_time = task_request.start_time
+        end_time = task_request.end_time
+        if start_time is None and end_time is None:
+            return
+
+        new_start = start_time or existing_task.start_time
+        new_end = end_time or existing_task.end_time
+
+        # Shrinking (or keeping) the range within the old bounds cannot
+        # create a conflict the task didn't already have, so the overlap
+        # query can be skipped
+        if (new_start >= existing_task.start_time
+                and new_end <= existing_task.end_time):
+            return
+
+        conflicting_id = await repository.check_first_conflict(
+            user_id, new_start, new_end, existing_task.id
+        )
+
+        if conflicting_id is not None:
+            raise ScheduleConflictError(conflicting_id)
     
+    @staticmethod
     def _validate_status_transition(
-        self, 
-        current_status: TaskStatus, 
+        current_status: TaskStatus,
         new_status: TaskStatus
     ) -> None:
         """Validate that status transition is allowed"""
-        
-        # Define allowed transitions
-        allowed_transitions = {
-            TaskStatus.PENDING: [TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED],
-            TaskStatus.IN_PROGRESS: [TaskStatus.COMPLETED, TaskStatus.BLOCKED, TaskStatus.CANCELLED],
-            TaskStatus.BLOCKED: [TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED],
-            TaskStatus.COMPLETED: [],  # Final state
-            TaskStatus.CANCELLED: []   # Final state
-        }
-        
-        allowed = allowed_transitions.get(current_status, [])
-        
-        if new_status not in allowed and new_status != current_status:
+
+        if not _is_transition_allowed(current_status, new_status):
             raise ValidationError(
                 f"Invalid status transition from {current_status.value} to {new_status.value}"
-            ) 
\ No newline at end of file
+            )
\ No newline at end of file